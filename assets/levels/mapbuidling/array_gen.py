@@ -1,60 +1,73 @@
 import json
 
-with open("test.ldtk") as f:
-    data = json.load(f)
-
-level_num = int(input("Enter level number: "))
 px_to_grid = 32
 
-for layer in data["levels"]:
-    if layer["identifier"] == f"Level_{level_num}":
-        width, height = layer["pxWid"] // px_to_grid, layer["pxHei"] // px_to_grid
-        grid = [[0 for x in range(width)] for y in range(height)]
-        for map_data in layer["layerInstances"]:
-            if map_data["__identifier"] == "Tiles":
-                tilemap = map_data["gridTiles"]
-            else:
-                entites = map_data["entityInstances"]
-        break
-
-# tiles
-for obj in tilemap:
-    x, y = obj["px"]
-    x, y = x // px_to_grid, y // px_to_grid
-    grid[y][x] = obj["t"]
-
-# entities
-entity_dict_list = []
-for entity in entites:
-    x, y = entity["__grid"]
-    if entity["__identifier"] == "Player":
-        spawn = [x, y]
+
+def ldtk_to_level(data, level_num, px_to_grid=px_to_grid):
+    """Converts Level_<level_num> of a parsed LDtk export into {"tiles", "enemies", "spawn"} (level_N.json layout)."""
+    for layer in data["levels"]:
+        if layer["identifier"] == f"Level_{level_num}":
+            width, height = layer["pxWid"] // px_to_grid, layer["pxHei"] // px_to_grid
+            grid = [[0 for x in range(width)] for y in range(height)]
+            for map_data in layer["layerInstances"]:
+                if map_data["__identifier"] == "Tiles":
+                    tilemap = map_data["gridTiles"]
+                else:
+                    entites = map_data["entityInstances"]
+            break
     else:
-        entity_dict_list.append({
-            "type": entity["__identifier"].lower(),
-            "x": x,
-            "y": y
-        })
-
-# --- custom JSON output ---
-print("{")
-print('    "tiles": [')
-
-for i, row in enumerate(grid):
-    line = "        [" + ", ".join(f"{n:2}" for n in row) + "]"
-    if i < len(grid) - 1:
-        line += ","
-    print(line)
-
-print("    ],")
-
-print('    "enemies": [')
-for i, entity in enumerate(entity_dict_list):
-    line = "        " + json.dumps(entity)
-    if i < len(entity_dict_list) - 1:
-        line += ","
-    print(line)
-print("    ],")
-
-print(f'    "spawn": {spawn}')
-print("}")
+        raise ValueError(f"Level_{level_num} not found in the LDtk export")
+
+    # tiles
+    for obj in tilemap:
+        x, y = obj["px"]
+        x, y = x // px_to_grid, y // px_to_grid
+        grid[y][x] = obj["t"]
+
+    # entities
+    spawn = [0, 0]
+    entity_dict_list = []
+    for entity in entites:
+        x, y = entity["__grid"]
+        if entity["__identifier"] == "Player":
+            spawn = [x, y]
+        else:
+            entity_dict_list.append({
+                "type": entity["__identifier"].lower(),
+                "x": x,
+                "y": y
+            })
+
+    return {"tiles": grid, "enemies": entity_dict_list, "spawn": spawn}
+
+
+if __name__ == "__main__":
+    with open("test.ldtk") as f:
+        data = json.load(f)
+
+    level_num = int(input("Enter level number: "))
+    level = ldtk_to_level(data, level_num)
+    grid, entity_dict_list, spawn = level["tiles"], level["enemies"], level["spawn"]
+
+    # --- custom JSON output ---
+    print("{")
+    print('    "tiles": [')
+
+    for i, row in enumerate(grid):
+        line = "        [" + ", ".join(f"{n:2}" for n in row) + "]"
+        if i < len(grid) - 1:
+            line += ","
+        print(line)
+
+    print("    ],")
+
+    print('    "enemies": [')
+    for i, entity in enumerate(entity_dict_list):
+        line = "        " + json.dumps(entity)
+        if i < len(entity_dict_list) - 1:
+            line += ","
+        print(line)
+    print("    ],")
+
+    print(f'    "spawn": {spawn}')
+    print("}")
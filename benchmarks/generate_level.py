@@ -0,0 +1,162 @@
+"""Generates large random levels for scaling tests.
+
+Run from the repository root, e.g. the biggest stress level:
+    python -m benchmarks.generate_level --id 100 --width 2000 --height 200 --enemies 500
+    python -m benchmarks.run --levels 100
+
+Writes assets/levels/level_N.json, assets/tiles/level_N_data.json and copies the tile set of --base.
+Ids from 100 up are ignored by git.
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+
+import numpy as np
+
+import game.enemies  # Registers the enemy classes
+from game.enemies.enemy_registry import ENEMY_CLASSES
+
+DEFAULT_MIX = "guard=4,drone=3,charger=2,battery=1,turret=1"
+GROUND_ENEMIES = {"guard", "charger", "battery", "turret", "emp_radar", "neuros"}
+SPAWN_CLEARANCE = 8  # Tiles around the spawn kept free of spikes and enemies
+
+
+def find_tile(tiles, tile_type, **metadata):
+    """Id of the first tile of the given type (and metadata values) in a *_data.json tile table."""
+    for tile_id, info in tiles.items():
+        if info["type"] != tile_type:
+            continue
+        if all(info.get("metadata", {}).get(key) == value for key, value in metadata.items()):
+            return int(tile_id)
+    return None
+
+
+def parse_mix(mix):
+    """'guard=4,drone=1' -> {'guard': 4, 'drone': 1}"""
+    weights = {}
+    for entry in mix.split(","):
+        name, _, weight = entry.partition("=")
+        name = name.strip()
+        if name not in ENEMY_CLASSES:
+            raise ValueError(f"Unknown enemy type '{name}', known: {', '.join(sorted(ENEMY_CLASSES))}")
+        weights[name] = float(weight or 1)
+    return weights
+
+
+def generate(width, height, density, decor, platforms, spikes, enemies, mix, tiles, rng):
+    """Builds the tile grid ([y, x] uint16) and the enemy list of a level."""
+    block = find_tile(tiles, "block")
+    spike = next((int(i) for i, info in tiles.items()
+                  if info["type"] == "spike" and info.get("hitbox", {}).get("offset_y")), None)
+    platform = find_tile(tiles, "moving_platform", direction="horizontal")
+    decorations = [int(i) for i, info in tiles.items() if info["type"] == "decoration"]
+    if block is None:
+        raise ValueError("The base tile set has no block tile")
+
+    grid = np.zeros((height, width), dtype=np.uint16)
+
+    # Ground: random walk of the surface row, solid below
+    surface = np.empty(width, dtype=np.int64)
+    top_limit, bottom_limit = max(8, height * 3 // 5), height - 3
+    y = (top_limit + bottom_limit) // 2
+    for x in range(width):
+        if x > SPAWN_CLEARANCE and rng.random() < 0.15:
+            y = min(bottom_limit, max(top_limit, y + rng.choice((-2, -1, 1, 2))))
+        surface[x] = y
+        grid[y:, x] = block
+
+    # Floating solid ledges in the air, at least 4 tiles above the ground
+    air_cells = int((surface - 4).clip(0).sum())
+    for _ in range(int(air_cells * density / 4)):
+        length = rng.randint(2, 6)
+        x = rng.randrange(SPAWN_CLEARANCE, max(SPAWN_CLEARANCE + 1, width - length))
+        ceiling = int(surface[x:x + length].min()) - 4
+        if ceiling > 2:
+            grid[rng.randrange(2, ceiling), x:x + length] = block
+
+    # Moving platforms need a free run to move along
+    for _ in range(platforms if platform is not None else 0):
+        x = rng.randrange(SPAWN_CLEARANCE, width - 4)
+        ceiling = int(surface[x:x + 4].min()) - 4
+        if ceiling > 2:
+            y = rng.randrange(2, ceiling)
+            if not grid[y, x - 1:x + 4].any():
+                grid[y, x] = platform
+
+    # Decoration tiles only cost rendering
+    if decorations:
+        rows, cols = np.nonzero(grid == 0)
+        picks = rng.sample(range(len(rows)), min(len(rows), int(len(rows) * decor)))
+        for index in picks:
+            grid[rows[index], cols[index]] = rng.choice(decorations)
+
+    # Spikes on the ground surface
+    spike_columns = set()
+    for _ in range(spikes if spike is not None else 0):
+        x = rng.randrange(SPAWN_CLEARANCE, width)
+        grid[surface[x] - 1, x] = spike
+        spike_columns.add(x)
+
+    # Enemies: ground types stand on the surface, the rest floats in the air above it
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    enemy_list = []
+    for _ in range(enemies):
+        name = rng.choices(names, weights)[0]
+        x = rng.randrange(SPAWN_CLEARANCE, width - 1)
+        while x in spike_columns:
+            x = rng.randrange(SPAWN_CLEARANCE, width - 1)
+        if name in GROUND_ENEMIES:
+            y = int(surface[x]) - 2
+        else:
+            y = rng.randrange(2, max(3, int(surface[x]) - 4))
+        grid[max(0, y - 1):y + 2, x] = 0  # Room to stand (or hover) in
+        enemy_list.append({"type": name, "x": x, "y": y})
+
+    spawn = [2, int(surface[2]) - 2]
+    return grid, enemy_list, spawn
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate a stress-test level")
+    parser.add_argument("--id", type=int, default=100, help="level id to write (default 100)")
+    parser.add_argument("--base", type=int, default=3, help="level whose tile set and tile data are reused")
+    parser.add_argument("--width", type=int, default=2000, help="width in tiles")
+    parser.add_argument("--height", type=int, default=200, help="height in tiles")
+    parser.add_argument("--density", type=float, default=0.02, help="fraction of air filled with solid ledges")
+    parser.add_argument("--decor", type=float, default=0.02, help="fraction of air filled with decoration")
+    parser.add_argument("--platforms", type=int, default=200, help="number of moving platforms")
+    parser.add_argument("--spikes", type=int, default=400, help="number of spikes")
+    parser.add_argument("--enemies", type=int, default=500, help="number of enemies")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"enemy weights (default {DEFAULT_MIX})")
+    parser.add_argument("--time", type=int, default=600, help="time_to_finish in seconds")
+    parser.add_argument("--seed", type=int, default=1)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    with open(f"assets/tiles/level_{args.base}_data.json") as f:
+        tile_data = json.load(f)
+
+    grid, enemy_list, spawn = generate(
+        args.width, args.height, args.density, args.decor, args.platforms, args.spikes, args.enemies,
+        parse_mix(args.mix), tile_data["tiles"], random.Random(args.seed)
+    )
+
+    level_path = f"assets/levels/level_{args.id}.json"
+    with open(level_path, "w") as f:
+        json.dump({"tiles": grid.tolist(), "enemies": enemy_list, "spawn": spawn,
+                   "time_to_finish": args.time}, f, separators=(",", ":"))
+    with open(f"assets/tiles/level_{args.id}_data.json", "w") as f:
+        json.dump(tile_data, f, indent=2)
+    shutil.copyfile(f"assets/tiles/level_{args.base}_set.png", f"assets/tiles/level_{args.id}_set.png")
+
+    print(f"[INFO] Wrote {level_path}: {args.width}x{args.height} tiles, {np.count_nonzero(grid)} filled, "
+          f"{len(enemy_list)} enemies ({os.path.getsize(level_path) // 1024} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""Benchmarks level load, simulation and rendering for every level in assets/levels.
+
+Run from the repository root:
+    python -m benchmarks.run --output bench.json
+    python -m benchmarks.run --baseline bench.json --threshold 0.15
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from core.assets import clear_caches
+from core.game_data import load_data
+from core.replay import Replay
+from game.level_format import find_levels
+from game.level_template import clear_level_templates
+
+SEED = 1
+
+
+def scripted_input(actions, steps):
+    """Deterministic input: run right (left every 4th 200-tick block), jump, attack and flip regularly."""
+    bits = {action: 1 << bit for bit, action in enumerate(actions)}
+    states = []
+    for tick in range(steps):
+        state = 0
+        state |= bits["move_left"] if (tick // 200) % 4 == 3 else bits["move_right"]
+        if tick % 40 < 10:
+            state |= bits["jump"]
+        if tick % 25 < 10:
+            state |= bits["attack"]
+        if tick % 300 == 150:
+            state |= bits["gravity_inverse"]
+        states.append(state)
+    return states
+
+
+def summarize(samples_ns):
+    """Timing summary in ms."""
+    samples = np.asarray(samples_ns, dtype=np.float64) / 1e6
+    p50, p95, p99 = np.percentile(samples, (50, 95, 99))
+    return {
+        "n": len(samples),
+        "mean": float(samples.mean()),
+        "min": float(samples.min()),
+        "p50": float(p50),
+        "p95": float(p95),
+        "p99": float(p99),
+    }
+
+
+def bench_load(engine, level_id, repeat):
+    """Level.__init__ with empty asset caches and level templates (cold), and again with both warm (retry)."""
+    from game.levels import Level
+
+    cold = []
+    warm = []
+    for _ in range(repeat):
+        clear_caches()
+        clear_level_templates()
+        start = time.perf_counter_ns()
+        Level(level_id, engine.controls, engine.sound_manager, engine, SEED)
+        cold.append(time.perf_counter_ns() - start)
+
+        start = time.perf_counter_ns()
+        Level(level_id, engine.controls, engine.sound_manager, engine, SEED)
+        warm.append(time.perf_counter_ns() - start)
+    return summarize(cold), summarize(warm)
+
+
+def bench_update(engine, level_id, steps, replay=None):
+    """Times Level.update per tick while feeding scripted (or recorded) input.
+    Death or finishing restarts the level, outside of the measurement."""
+    if replay is not None:
+        replay.remap(engine.controls.actions)
+        states, seed = replay.states, replay.seed
+    else:
+        states, seed = scripted_input(engine.controls.actions, steps), SEED
+    engine.start_headless_level(level_id, seed)
+
+    samples = []
+    restarts = 0
+    for tick in range(min(steps, len(states))):
+        if not engine.is_playing:
+            restarts += 1
+            engine.start_headless_level(level_id, seed)
+        level = engine.level
+        engine.controls.feed(states[tick])
+
+        start = time.perf_counter_ns()
+        level.update(engine.dt, engine)
+        samples.append(time.perf_counter_ns() - start)
+
+        engine.camera.follow(level.player)
+        level.check_touch(level.player, engine)
+
+    result = summarize(samples)
+    result["restarts"] = restarts
+    result["ticks_per_s"] = len(samples) / (sum(samples) / 1e9) if samples else 0.0
+    return result
+
+
+def bench_render(engine, level_id, frames):
+    """Times Level.render into an offscreen surface with the camera swept over the whole level."""
+    engine.start_headless_level(level_id, SEED)
+    level = engine.level
+    camera = engine.camera
+    surface = pygame.Surface(engine.native_size)
+
+    span_x = max(0, level.width - camera.width)
+    span_y = max(0, level.height - camera.height)
+    samples = []
+    for frame in range(frames):
+        t = frame / max(1, frames - 1)
+        camera.camera.topleft = (round(span_x * t), round(span_y * (0.5 + 0.5 * np.sin(t * 6.28))))
+        camera.prev_x, camera.prev_y = camera.camera.topleft
+        camera.offset_x, camera.offset_y = camera.camera.topleft
+        surface.fill((0, 0, 0))
+
+        start = time.perf_counter_ns()
+        level.render(surface, camera)
+        samples.append(time.perf_counter_ns() - start)
+    return summarize(samples)
+
+
+def run(levels, repeat, steps, frames, replays):
+    from core.engine import GameEngine
+
+    engine = GameEngine(headless=True)
+    engine.profiler.enabled = False
+    # Level.render converts surfaces for the display format, the dummy driver still needs a mode
+    pygame.display.set_mode(engine.native_size)
+
+    results = {}
+    for level_id in levels:
+        cold, warm = bench_load(engine, level_id, repeat)
+        results[str(level_id)] = {
+            "load_cold": cold,
+            "load_warm": warm,
+            "update": bench_update(engine, level_id, steps, replays.get(level_id)),
+            "render": bench_render(engine, level_id, frames),
+        }
+        print(f"[INFO] Level {level_id}: load {cold['p50']:.1f} / {warm['p50']:.1f} ms (cold / warm), "
+              f"update {results[str(level_id)]['update']['p50']:.3f} ms, "
+              f"render {results[str(level_id)]['render']['p50']:.3f} ms")
+    return results
+
+
+def compare(results, baseline, threshold, metric="p50"):
+    """Returns the (level, benchmark, old, new) entries that got slower than baseline * (1 + threshold)."""
+    regressions = []
+    for level_id, benches in results.items():
+        old_benches = baseline.get(level_id)
+        if old_benches is None:
+            continue
+        for name, stats in benches.items():
+            old = old_benches.get(name, {}).get(metric)
+            if old and stats[metric] > old * (1 + threshold):
+                regressions.append((level_id, name, old, stats[metric]))
+    return regressions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Level load / update / render benchmarks")
+    parser.add_argument("--levels", help="comma separated level ids (default: every assets/levels/level_N.json)")
+    parser.add_argument("--repeat", type=int, default=5, help="level loads per level")
+    parser.add_argument("--steps", type=int, default=2000, help="simulation steps per level")
+    parser.add_argument("--frames", type=int, default=300, help="rendered frames per level")
+    parser.add_argument("--replay", action="append", default=[], metavar="PATH",
+                        help="use a recorded replay as input for its level (repeatable)")
+    parser.add_argument("--output", metavar="PATH", help="write the results as JSON")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against an earlier --output file")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="relative slowdown of a p50 that counts as regression (default 0.15)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    load_data("data/game_data.json")
+
+    levels = [int(level) for level in args.levels.split(",")] if args.levels else find_levels()
+    replays = {}
+    for path in args.replay:
+        replay = Replay.load(path)
+        replays[replay.level_id] = replay
+
+    results = run(levels, args.repeat, args.steps, args.frames, replays)
+    report = {
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "unit": "ms",
+        "settings": {"repeat": args.repeat, "steps": args.steps, "frames": args.frames, "seed": SEED},
+        "levels": results,
+    }
+
+    if args.output:
+        directory = os.path.dirname(args.output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=1)
+        print(f"[INFO] Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline["levels"], args.threshold)
+        for level_id, name, old, new in regressions:
+            print(f"[WARNING] Level {level_id} {name}: {old:.3f} -> {new:.3f} ms (+{(new / old - 1) * 100:.0f}%)")
+        if regressions:
+            sys.exit(1)
+        print(f"[INFO] No regressions above {args.threshold * 100:.0f}% against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
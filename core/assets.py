@@ -0,0 +1,182 @@
+import json
+from collections import OrderedDict
+import pygame
+
+
+def has_display():
+    """Returns True if a display surface exists that images can be converted for."""
+    return pygame.display.get_surface() is not None
+
+
+def load_image(path, alpha=True):
+    """Loads an image and converts it to the display format when a display is available."""
+    return convert_image(pygame.image.load(path), alpha)
+
+
+def convert_image(image, alpha=True):
+    """Converts a decoded image to the display format when a display is available. Main thread only."""
+    if not has_display():
+        return image  # Headless: keep the file format, blitting still works
+    return image.convert_alpha() if alpha else image.convert()
+
+
+# Process-wide caches, shared by every entity using the same files
+_images = {}
+_animation_sets = {}
+_flipped_frames = {}
+_rotation_caches = {}
+_scaled_images = {}
+
+
+def get_image(path, alpha=True):
+    """Cached load_image for images that are never modified after loading."""
+    key = (path, alpha)
+    image = _images.get(key)
+    if image is None:
+        image = _images[key] = load_image(path, alpha)
+    return image
+
+
+def is_image_cached(path, alpha=True):
+    return (path, alpha) in _images
+
+
+def store_image(path, image, alpha=True):
+    """Converts an image decoded elsewhere (e.g. on a loader thread) and puts it in the get_image cache."""
+    key = (path, alpha)
+    if key not in _images:
+        _images[key] = convert_image(image, alpha)
+    return _images[key]
+
+
+def get_scaled_image(path, scale):
+    """Cached image scaled by a factor (e.g. background layers), never modify the result."""
+    key = (path, scale)
+    image = _scaled_images.get(key)
+    if image is None:
+        original = get_image(path)
+        size = (int(original.get_width() * scale), int(original.get_height() * scale))
+        image = _scaled_images[key] = pygame.transform.scale(original, size)
+    return image
+
+
+class AnimationSet:
+    def __init__(self, sprite_path, json_path, scale=None):
+        """Sprite metadata and scaled animation frames. Frames are shared, never draw on them."""
+        self.sprite_path = sprite_path
+        with open(json_path) as f:
+            self.data = json.load(f)
+
+        self.entity_size = tuple(self.data.get("entity_size", [16, 16]))
+        self.scale = self.data.get("entity_scale", 1.0) if scale is None else scale
+        self.tile_size = self.data.get("tile_size", 16)
+        self.frame_size = int(self.tile_size * self.scale)
+
+        sprite_sheet = get_image(sprite_path)
+        self.frames = {}
+        for state, frames in self.data["animations"].items():
+            scaled = []
+            for frame in frames:
+                col, row = map(int, frame.split(","))
+                x, y = col * self.tile_size, row * self.tile_size
+                sprite = sprite_sheet.subsurface((x, y, self.tile_size, self.tile_size))
+                scaled.append(pygame.transform.scale(sprite, (self.frame_size, self.frame_size)))
+            self.frames[state] = tuple(scaled)
+
+
+def get_animation_set(sprite_path, json_path, scale=None):
+    """Returns the shared AnimationSet for these files, loading it on first use."""
+    key = (sprite_path, json_path, scale)
+    animation_set = _animation_sets.get(key)
+    if animation_set is None:
+        animation_set = _animation_sets[key] = AnimationSet(sprite_path, json_path, scale)
+    return animation_set
+
+
+def get_flipped(frames, flip_x, flip_y):
+    """Returns a shared frame tuple mirrored as requested. Each orientation is flipped once, on first use."""
+    if not (flip_x or flip_y):
+        return frames
+    key = (id(frames), flip_x, flip_y)
+    entry = _flipped_frames.get(key)
+    if entry is None or entry[0] is not frames:
+        # Keep the source alive with its variant, so its id can't be reused by another tuple
+        entry = _flipped_frames[key] = (frames, tuple(pygame.transform.flip(frame, flip_x, flip_y) for frame in frames))
+    return entry[1]
+
+
+class RotationCache:
+    def __init__(self, step=1, budget=None):
+        """Rotated copies of shared frames, with angles snapped to multiples of step degrees.
+        With a budget (in bytes) the least recently used rotations are dropped once it is exceeded."""
+        self.step = step
+        self.budget = budget
+        self.rotations = OrderedDict()  # (id(image), angle, flip_x) -> (image, rotated image)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, image, angle, flip_x=False):
+        """Returns image rotated by angle rounded to the nearest bucket (then mirrored), rotating on first use."""
+        angle = round(angle / self.step) * self.step % 360
+        if angle == 0 and not flip_x:
+            return image
+        key = (id(image), angle, flip_x)
+        entry = self.rotations.get(key)
+        if entry is not None and entry[0] is image:
+            self.hits += 1
+            if self.budget is not None:
+                self.rotations.move_to_end(key)
+            return entry[1]
+
+        self.misses += 1
+        rotated = pygame.transform.rotate(image, angle)
+        if flip_x:
+            rotated = pygame.transform.flip(rotated, True, False)
+        if entry is not None:
+            self.bytes -= surface_bytes(entry[1])
+        self.rotations[key] = (image, rotated)
+        self.bytes += surface_bytes(rotated)
+
+        if self.budget is not None:
+            self.rotations.move_to_end(key)
+            while self.bytes > self.budget and len(self.rotations) > 1:
+                _, (_, dropped) = self.rotations.popitem(last=False)
+                self.bytes -= surface_bytes(dropped)
+        return rotated
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        self.rotations.clear()
+        self.bytes = 0
+
+
+def surface_bytes(surface):
+    """Pixel memory of a surface in bytes."""
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def get_rotation_cache(sprite_path, step=1, budget=None):
+    """Returns the shared RotationCache of a sprite sheet with this step and budget, creating it on first use."""
+    key = (sprite_path, step, budget)
+    cache = _rotation_caches.get(key)
+    if cache is None:
+        cache = _rotation_caches[key] = RotationCache(step, budget)
+    return cache
+
+
+def get_rotation_caches():
+    """All rotation caches by (sprite sheet path, step, budget) (for the debug overlay)."""
+    return _rotation_caches
+
+
+def clear_caches():
+    """Drops all cached images and animations, e.g. after the display format changed."""
+    _images.clear()
+    _animation_sets.clear()
+    _flipped_frames.clear()
+    _rotation_caches.clear()
+    _scaled_images.clear()
@@ -9,10 +9,18 @@ class Camera:
         self.level_width = level_width
         self.level_height = level_height
 
+        # Render offset, interpolated between the last two simulation steps
+        self.prev_x = 0
+        self.prev_y = 0
+        self.offset_x = 0
+        self.offset_y = 0
+        self.alpha = 1.0
+
     def follow(self, target, smoothing=0.1):
         """Smoothly follows the target (e.g., player) using linear interpolation."""
         target_x = target.rect.centerx - self.width // 2
         target_y = target.rect.centery - self.height // 2
+        self.prev_x, self.prev_y = self.camera.topleft
 
         # Apply smoothing
         self.camera.x += int((target_x - self.camera.x) * smoothing)
@@ -21,15 +29,33 @@ class Camera:
         # Clamp the camera to the level bounds
         self.camera.x = max(0, min(self.camera.x, self.level_width - self.width))
         self.camera.y = max(0, min(self.camera.y, self.level_height - self.height))
+        self.offset_x, self.offset_y = self.camera.topleft
+        self.alpha = 1.0
+
+    def interpolate(self, alpha):
+        """Blends the render offset between the previous and the current simulation step."""
+        self.alpha = alpha
+        self.offset_x = round(self.prev_x + (self.camera.x - self.prev_x) * alpha)
+        self.offset_y = round(self.prev_y + (self.camera.y - self.prev_y) * alpha)
+
+    def lerp_offset(self, target):
+        """Returns how far the target is drawn behind its simulated position."""
+        prev_pos = getattr(target, "prev_pos", None)
+        if prev_pos is None or self.alpha >= 1:
+            return 0, 0
+        t = 1 - self.alpha
+        return round((prev_pos[0] - target.rect.x) * t), round((prev_pos[1] - target.rect.y) * t)
 
     def apply(self, target, speed=1):
         """Adjusts object position based on the camera's position."""
         if isinstance(target, pygame.Rect):
-            return target.move(-self.camera.x * speed, -self.camera.y)
+            return target.move(-self.offset_x * speed, -self.offset_y)
         elif hasattr(target, "render_rect"):
-            return target.render_rect.move(-self.camera.x * speed, -self.camera.y)
+            dx, dy = self.lerp_offset(target)
+            return target.render_rect.move(dx - self.offset_x * speed, dy - self.offset_y)
         elif hasattr(target, "rect"):
-            return target.rect.move(-self.camera.x * speed, -self.camera.y)
+            dx, dy = self.lerp_offset(target)
+            return target.rect.move(dx - self.offset_x * speed, dy - self.offset_y)
         return target
 
     def get_viewport(self):
@@ -6,6 +6,11 @@ class Controls:
         self.settings = Settings()
         self.controls = self.settings.get("controls")
 
+        # Snapshot of all actions for the current simulation tick, one bit per action
+        self.actions = list(self.controls) + ["attack"]  # attack = left mouse button
+        self.action_bits = {action: 1 << bit for bit, action in enumerate(self.actions)}
+        self.state = 0
+
     def bind_key(self, action, new_key, index=0):
         """Rebinds a key to an action at a specific index."""
         # Check for duplicates across all actions
@@ -20,6 +25,28 @@ class Controls:
         keys = pygame.key.get_pressed()
         return any(keys[key] for key in self.controls.get(action, []) if key is not None)
 
+    def poll(self):
+        """Snapshots keyboard and mouse once for the coming simulation tick."""
+        keys = pygame.key.get_pressed()
+        state = 0
+        for action, bit in self.action_bits.items():
+            if action == "attack":
+                pressed = pygame.mouse.get_pressed()[0]
+            else:
+                pressed = any(keys[key] for key in self.controls.get(action, []) if key is not None)
+            if pressed:
+                state |= bit
+        self.state = state
+        return state
+
+    def feed(self, state):
+        """Uses a recorded snapshot (see core.replay) for the coming tick instead of polling."""
+        self.state = state
+
+    def is_down(self, action):
+        """Returns True if the action was held when the current tick was snapshotted."""
+        return bool(self.state & self.action_bits.get(action, 0))
+
     def get_keys(self, action):
         """Returns the list of keys for an action."""
         return self.controls.get(action, [None, None])
@@ -1,34 +1,81 @@
 import json
+import os
+import time
+import numpy as np
 import pygame
 
+from core.assets import get_animation_set, get_rotation_caches, get_scaled_image
 from core.camera import Camera
 from core.font import FontManager
 from core.game_data import get_game_data
+from core.preloader import AssetPreloader
+from core.profiler import Profiler
+from core.replay import Replay
 from core.sound import SoundManager
-from game.background import Background
+from game.background import BackgroundCompositor
+from game.enemies.enemy_registry import ENEMY_CLASSES
+from game.level_format import load_level_data
+from game.level_template import get_level_template, has_level_template
 from game.levels import Level
 from game.menu.menu import Menu, MenuState
 from core.controls import Controls
 from game.user_interface import UI
 
 class GameEngine:
-    def __init__(self):
-        pygame.init()
+    def __init__(self, headless=False, profile_path=None, record_path=None):
+        # Headless: no window and no audio, only the simulation is stepped
+        self.headless = headless
+        if headless:
+            # Only the modules the simulation needs, pygame.init() would also open the audio device
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            pygame.display.init()
+            pygame.font.init()
+        else:
+            pygame.init()
 
         # Settings
         self.native_size = get_game_data("screen_size")
         self.fps = get_game_data("fps")
         self.dt = 1 / self.fps
         self.clock = pygame.time.Clock()
+
+        # Fixed Timestep (logic runs at fps, rendering at render_fps)
+        self.fixed_timestep = get_game_data("fixed_timestep")
+        self.render_fps = get_game_data("render_fps")
+        self.max_frame_steps = get_game_data("max_frame_steps")
+        self.accumulator = 0
+        self.interpolation = 1.0
         self.controls = Controls()
 
+        # Input Replays (record_path: every level attempt is written there, the last one survives)
+        self.record_path = record_path
+        self.recording = None
+        self.replay = None
+
         # Display
-        self.screen = pygame.display.set_mode(self.native_size, pygame.RESIZABLE)
-        pygame.display.set_caption(get_game_data("game_title"))
+        self.screen = None
         self.scaled_surface = pygame.Surface(self.native_size)
+        self.scale_maps = None  # (scaled size, source column per column, source row per row), see present_rects
+
+        # Presentation: the frame gets scaled into a buffer sized for the window, rebuilt only on resize
+        # "nearest" fills the window, "integer" only uses whole-number scales (sharp pixels), "smooth" filters
+        self.scale_mode = get_game_data().get("scale_mode", "nearest")
+        if self.scale_mode not in ("nearest", "integer", "smooth"):
+            print(f"[WARNING] Unknown scale_mode '{self.scale_mode}', using 'nearest'")
+            self.scale_mode = "nearest"
+        self.window_size = None
+        self.present_scale = 1
+        self.present_size = tuple(self.native_size)
+        self.present_offset = (0, 0)
+        self.present_buffer = None  # None when the frame is shown unscaled
+
+        if not headless:
+            self.screen = pygame.display.set_mode(self.native_size, pygame.RESIZABLE)
+            pygame.display.set_caption(get_game_data("game_title"))
+            self.update_layout()
 
         # Main Theme Music
-        self.sound_manager = SoundManager()
+        self.sound_manager = SoundManager(enabled=not headless)
         self.sound_manager.play_music()
 
         # Game State
@@ -69,27 +116,46 @@ class GameEngine:
         self.ui = UI(self.font_manager, self.sound_manager)
 
         # Back-/Foregrounds (init later on level load)
-        self.backgrounds = []
+        self.background = None
         self.foreground = None
         self.show_foreground = False
 
         # Camera (init later on level load)
         self.camera = None
 
-        # Bottleneck Timings
-        self.logic_time = 0
-        self.render_time = 0
+        # Assets of the next level load on worker threads while its slides play (see preload_level)
+        self.preloader = AssetPreloader()
+        self.preload_level_id = None
+        self.preload_jobs = []
+        self.preload_steps = None
+        self.tutorial_jobs = []
+
+        # Bottleneck Timings (profile_path: written on exit, F4 dumps on demand)
+        self.profiler = Profiler()
+        self.profile_path = profile_path
         self.debug_overlay = False
         self.is_debug_pressed = False
+        self.is_dump_pressed = False
 
     def render_debug_overlay(self, surface):
         """Draw FPS and frame timing on screen."""
-        fps_text = f"FPS: {int(self.clock.get_fps())}"
-        logic_text = f"Logic: {self.logic_time} ms"
-        render_text = f"Render: {self.render_time} ms"
-
-        texts = [fps_text, logic_text, render_text]
-        y = 5
+        texts = ["Timings p50 / p95 / p99:"]
+        texts += self.profiler.overlay_lines()
+        if self.level is not None:
+            atlas = self.level.tile_atlas
+            texts.append(f"Tile images: {atlas.surface_bytes() // 1024} KB (unshared {atlas.unshared_bytes() // 1024} KB)")
+            field = self.level.distance_field
+            texts.append(f"Player map: {field.incremental_updates} repaired / {field.full_builds} rebuilt")
+        fonts = self.font_manager
+        texts.append(f"Text cache: hit rate {fonts.hit_rate():.2f}, {len(fonts.text_cache)} lines, {len(fonts.layout_cache)} layouts")
+        for (sprite_path, _, _), cache in get_rotation_caches().items():
+            name = os.path.splitext(os.path.basename(sprite_path))[0]
+            texts.append(
+                f"Rotations {name}: hit rate {cache.hit_rate():.2f}, {len(cache.rotations)} frames, {cache.bytes // 1024} KB"
+            )
+        # FPS changes every frame (glyph atlas), the rest only with each stats refresh (text cache)
+        self.font_manager.render_glyphs(self.scaled_surface, f"FPS: {int(self.clock.get_fps())}", (5, 5), 18)
+        y = 25
         for text in texts:
             self.font_manager.render(self.scaled_surface, text, (5, y), 18)
             y += 20
@@ -129,7 +195,7 @@ class GameEngine:
         self.show_level_title = False
         self.level_title = ""
         self.level_title_timer = 0
-        self.backgrounds = []
+        self.background = None
         self.foreground = None
         self.camera = None
 
@@ -144,27 +210,106 @@ class GameEngine:
         self.is_playing = True
 
     def load_levels_data(self, level_id):
-        """Load story + tutorial slides before a level"""
+        """Load story + tutorial slides before a level, the level itself loads in the background meanwhile"""
         self.current_level = level_id
         level_data = self.levels_data.get(str(level_id), {})
 
         self.story_texts = level_data.get("story", [])
         self.story_index = 0
-        self.tutorial_images = [pygame.image.load(path).convert() for path in level_data.get("tutorial", [])]
+        self.tutorial_images = []
         self.tutorial_index = 0
+        self.preload_level(level_id, level_data)
 
         if self.story_texts:
             self.slide_mode = "story"
-        elif self.tutorial_images:
-            self.slide_mode = "tutorial"
+        elif self.tutorial_jobs:
+            self.start_tutorial()
         else:
             self.slide_mode = None
             self.load_level(level_id)
 
-        bg_data = self.levels_data.get(str(level_id), {}).get("background", [])
-        self.backgrounds = [Background(layer) for layer in bg_data[::-1]]
-        self.foreground = pygame.image.load(level_data.get("foreground", "")).convert_alpha()
+    def preload_level(self, level_id, level_data):
+        """Starts decoding the images and parsing the level file on the preloader's workers.
+        Tutorial images come first, they are needed as soon as the story ends."""
+        preloader = self.preloader
+        jobs = self.preload_jobs = []
+        self.tutorial_jobs = [preloader.image(path, alpha=False, cached=False) for path in level_data.get("tutorial", [])]
+        jobs += self.tutorial_jobs
+        if str(level_id) not in self.levels_data:
+            self.preload_level_id = None
+            return
+
+        self.preload_level_id = level_id
+        self.preload_steps = None
+        self.preload_background = level_data.get("background", [])
+        sprites = self.preload_sprites = []
+        jobs += [preloader.image(layer["image"]) for layer in self.preload_background]
+        self.foreground_job = preloader.image(level_data.get("foreground", ""), cached=False)
+        jobs.append(self.foreground_job)
+
+        self.level_data_job = None
+        if not has_level_template(level_id):
+            def level_data_loaded(data):
+                # Sprite sheets of the player and every enemy type in the level
+                types = sorted({enemy["type"] for enemy in data.get("enemies", []) if enemy["type"] in ENEMY_CLASSES})
+                sprites.extend(["player"] + types)
+                jobs.extend(preloader.image(f"assets/characters/{name}.png") for name in sprites)
+                return data
+
+            jobs.append(preloader.image(f"assets/tiles/level_{level_id}_set.png"))
+            self.level_data_job = preloader.submit(load_level_data, level_id, finish=level_data_loaded)
+            jobs.append(self.level_data_job)
+
+    def update_preload(self):
+        """Main-thread part of preloading: converts finished files, then builds the level a few ms per tick."""
+        if self.preload_level_id is None or not self.preloader.poll():
+            return
+        if self.preload_steps is None:
+            self.preload_steps = self.build_preloaded(self.preload_level_id)
+            return  # Building starts next tick, this one already converted files
+
+        start = time.perf_counter()
+        for _ in self.preload_steps:
+            if time.perf_counter() - start > 0.004:
+                return
+        self.preload_level_id = None
+
+    def finish_preload(self):
+        """Completes preloading right away (the level is needed now), so creating the Level is instant."""
+        if self.preload_level_id is None:
+            return
+        self.preloader.wait()
+        if self.preload_steps is None:
+            self.preload_steps = self.build_preloaded(self.preload_level_id)
+        for _ in self.preload_steps:
+            pass
+        self.preload_level_id = None
+
+    def build_preloaded(self, level_id):
+        """Builds backgrounds, foreground, sprite sheets and the level template from the loaded files,
+        yielding after every step so update_preload can spread them over several ticks."""
+        scale = get_game_data("background_scale")
+        for layer in self.preload_background:
+            get_scaled_image(layer["image"], scale)
+            yield
+        self.background = BackgroundCompositor(self.preload_background[::-1])
+        yield
+        self.background.build(self.scaled_surface.get_size())
+        yield
+
+        self.foreground = self.foreground_job.value
         self.foreground.set_alpha(75)
+        for name in self.preload_sprites:
+            get_animation_set(f"assets/characters/{name}.png", f"assets/characters/{name}.json")
+            yield
+        self.ui.prepare()
+        yield
+        if self.level_data_job is not None:
+            get_level_template(level_id, self.level_data_job.value)
+
+    def start_tutorial(self):
+        self.slide_mode = "tutorial"
+        self.tutorial_images = self.preloader.wait(self.tutorial_jobs)
 
     def load_level(self, level_id):
         """Loads a level by ID. If level doesn't exist, go to credits or restart."""
@@ -175,21 +320,88 @@ class GameEngine:
                 self.menu.open_menu(MenuState.CREDITS, self)
             return
 
+        self.finish_preload()
         self.level = Level(level_id, self.controls, self.sound_manager, self)
+        self.start_recording()
         self.camera = Camera(self.native_size[0], self.native_size[1], self.level.width, self.level.height)
         self.show_level_title = True
         self.level_title_timer = 0
         self.level_title = self.levels_data.get(str(level_id), {}).get("title", f"Level {level_id + 1}")
 
+    def start_headless_level(self, level_id, seed=None):
+        """Loads a level straight into play, skipping slides, title and menus."""
+        self.reset_game_state()
+        self.current_level = level_id
+        self.level = Level(level_id, self.controls, self.sound_manager, self, seed)
+        self.start_recording()
+        self.camera = Camera(self.native_size[0], self.native_size[1], self.level.width, self.level.height)
+        self.menu.active_type = MenuState.NONE
+        self.is_playing = True
+
+    def run_headless(self, level_id, frames):
+        """Steps a level as fast as possible without rendering. Returns simulated frames per second."""
+        self.start_headless_level(level_id)
+
+        start = time.perf_counter()
+        for _ in range(frames):
+            # Death or level complete opened a menu: restart like the retry button does
+            if not self.is_playing:
+                self.start_headless_level(level_id)
+            with self.profiler.span("update"):
+                self.update()
+            self.profiler.end_frame()
+        elapsed = time.perf_counter() - start
+
+        return frames / elapsed if elapsed > 0 else float("inf")
+
+    def start_recording(self):
+        """Saves the previous attempt (if recording) and starts recording the freshly loaded level."""
+        if self.record_path is None or self.replay is not None:
+            return
+        self.save_recording()
+        self.recording = Replay(self.level.id, self.level.seed, self.controls.actions)
+
+    def save_recording(self):
+        if self.recording is not None and len(self.recording):
+            self.recording.save(self.record_path)
+            print(f"[INFO] Recorded {len(self.recording)} ticks of level {self.recording.level_id} to {self.record_path}")
+
+    def start_replay(self, replay):
+        """Starts the replay's level with its seed. Its input is fed in tick by tick until it runs out."""
+        replay.remap(self.controls.actions)
+        replay.position = 0
+        self.replay = replay
+        self.start_headless_level(replay.level_id, replay.seed)
+
+    def run_replay(self, replay):
+        """Plays a replay headless as fast as possible. Returns simulated ticks per second."""
+        self.start_replay(replay)
+
+        start = time.perf_counter()
+        ticks = 0
+        while not replay.finished() and self.is_playing:
+            with self.profiler.span("update"):
+                self.update()
+            self.profiler.end_frame()
+            ticks += 1
+        elapsed = time.perf_counter() - start
+
+        return ticks / elapsed if elapsed > 0 else float("inf")
+
     def handle_events(self):
         """Handles all game events like input and window resizing."""
         for event in pygame.event.get():  # Process one event at a time
             if event.type == pygame.QUIT:
+                self.save_recording()
+                if self.profile_path:
+                    self.dump_profile(self.profile_path)
                 pygame.quit()
                 exit()
 
             if event.type == pygame.VIDEORESIZE:
                 self.screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
+                self.update_layout()
+                self.menu.invalidate()  # The window content is gone, retained menus compose again
 
             if self.controls.is_action_active("menu"):
                 new = None
@@ -211,6 +423,14 @@ class GameEngine:
             else:
                 self.is_debug_pressed = False
 
+            # One dump per press: the flag only resets once the key is released
+            if self.controls.is_action_active("profile_dump"):
+                if not self.is_dump_pressed:
+                    self.dump_profile()
+                    self.is_dump_pressed = True
+            else:
+                self.is_dump_pressed = False
+
             if self.slide_mode:
                 if event.type in [pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN]:
                     self.next_slide()
@@ -219,22 +439,25 @@ class GameEngine:
             else:
                 self.menu.handle_event(event, self)
 
+    def dump_profile(self, path=None):
+        """Writes the recorded frame timings to disk."""
+        path = self.profiler.dump(path)
+        print(f"[INFO] Profile written to {path}")
+
     def get_scaled_mouse(self):
-        window_width, window_height = self.screen.get_size()
-        scale_x = window_width / self.native_size[0]
-        scale_y = window_height / self.native_size[1]
-        scale = min(scale_x, scale_y)
+        """Mouse position in native frame coordinates, using the same scale and offset the frame is shown with."""
+        if self.window_size != self.screen.get_size():
+            self.update_layout()
 
         mouse_x, mouse_y = pygame.mouse.get_pos()
 
-        scaled_x = (mouse_x - (window_width - self.native_size[0] * scale) / 2) / scale
-        scaled_y = (mouse_y - (window_height - self.native_size[1] * scale) / 2) / scale
+        scaled_x = (mouse_x - self.present_offset[0]) / self.present_scale
+        scaled_y = (mouse_y - self.present_offset[1]) / self.present_scale
 
         return int(scaled_x), int(scaled_y)
 
     def update(self):
         """Updates all game objects and logic."""
-        start = pygame.time.get_ticks()
         self.timer += 1
         if self.slow:
             if self.timer % 2:
@@ -244,6 +467,7 @@ class GameEngine:
         self.dt = 1 / self.fps
 
         if self.slide_mode:
+            self.update_preload()
             self.slide_timer += 1
 
             multiplier = 2 if self.slide_mode == "tutorial" else 1
@@ -255,27 +479,44 @@ class GameEngine:
             return
 
         # Prevent crash if level not loaded yet
-        if not self.level:
+        if self.level is None:
             return
 
         if self.is_playing:
-            self.level.update(self.dt, self)
-            self.camera.follow(self.level.player)
-            self.ui.update(self.level.player)
+            # Snapshot the input of this tick (from the replay while one is playing)
+            if self.replay is not None and self.replay.finished():
+                self.replay = None
+                print("[INFO] Replay finished, back to live input")
+            if self.replay is not None:
+                self.controls.feed(self.replay.next_state())
+            else:
+                self.controls.poll()
+            if self.recording is not None:
+                self.recording.record(self.controls.state)
+
+            profiler = self.profiler
+            with profiler.span("level_update"):
+                self.level.update(self.dt, self)
+            with profiler.span("camera"):
+                self.camera.follow(self.level.player)
+            with profiler.span("ui"):
+                self.ui.update(self.level.player)
             self.level.check_touch(self.level.player, self)
 
             if self.show_level_title:
                 self.level_title_timer += 1
                 if self.level_title_timer >= self.level_title_duration:
                     self.show_level_title = False
-        self.logic_time = pygame.time.get_ticks() - start
 
     def next_slide(self):
         """Progresses to the next slide in the current slide mode."""
         if self.slide_mode == "story":
             self.story_index += 1
             if self.story_index >= len(self.story_texts):
-                self.slide_mode = "tutorial" if self.tutorial_images else None
+                if self.tutorial_jobs:
+                    self.start_tutorial()
+                else:
+                    self.slide_mode = None
         elif self.slide_mode == "tutorial":
             self.tutorial_index += 1
             if self.tutorial_index >= len(self.tutorial_images):
@@ -287,38 +528,112 @@ class GameEngine:
 
     def render(self):
         """Renders everything on a fixed surface and scales it while keeping the aspect ratio."""
-        start = pygame.time.get_ticks()
+        profiler = self.profiler
+        if self.render_static_menu():
+            return
         self.scaled_surface.fill((0, 0, 0))
 
         if self.slide_mode == "story":
             self.render_story(self.scaled_surface)
+            self.render_preload_progress(self.scaled_surface)
         elif self.slide_mode == "tutorial":
             self.render_tutorial(self.scaled_surface)
+            self.render_preload_progress(self.scaled_surface)
         elif self.is_playing:
-            if not self.level:
+            if self.level is None:
                 self.load_level(self.current_level)
 
-            for bg in self.backgrounds:
-                bg.render(self.scaled_surface, self.camera)
+            if self.fixed_timestep:
+                with profiler.span("camera"):
+                    self.camera.interpolate(self.interpolation)
 
-            self.level.render(self.scaled_surface, self.camera)
-            self.ui.render(self.scaled_surface)
+            with profiler.span("background"):
+                if self.background is not None:
+                    self.background.render(self.scaled_surface, self.camera)
 
-            if self.show_level_title:
-                self.render_level_title(self.scaled_surface)
+            self.level.render(self.scaled_surface, self.camera)  # tile_render + entity_render spans
+
+            with profiler.span("ui"):
+                self.ui.render(self.scaled_surface)
+
+                if self.show_level_title:
+                    self.render_level_title(self.scaled_surface)
 
-            if self.show_foreground:
-                self.scaled_surface.blit(self.foreground, (0, 0))
+                if self.show_foreground:
+                    self.scaled_surface.blit(self.foreground, (0, 0))
         else:
-            self.menu.render(self.scaled_surface, self)
+            with profiler.span("menu"):
+                self.menu.render(self.scaled_surface, self)
 
         if self.debug_overlay:
             self.render_debug_overlay(self.scaled_surface)
 
-        self.scale_and_center()
-        pygame.display.flip()
-
-        self.render_time = pygame.time.get_ticks() - start
+        with profiler.span("scale_and_center"):
+            self.scale_and_center()
+        with profiler.span("flip"):
+            pygame.display.flip()
+
+    def render_static_menu(self):
+        """Static menu pages (pause, death) keep the previous frame and only redraw and present the buttons
+        that changed. Returns False if the frame has to be rendered the normal way."""
+        if self.slide_mode or self.is_playing or self.debug_overlay or not self.menu.is_static():
+            self.menu.invalidate()
+            return False
+
+        profiler = self.profiler
+        with profiler.span("menu"):
+            dirty = self.menu.render_changes(self.scaled_surface, self)
+
+        if dirty is None or (dirty and self.scale_mode == "smooth"):  # Filtered scaling blurs across rect edges
+            with profiler.span("scale_and_center"):
+                self.scale_and_center()
+            with profiler.span("flip"):
+                pygame.display.flip()
+        elif dirty:
+            with profiler.span("present"):
+                self.present_rects(dirty)
+        return True
+
+    def get_scale_maps(self, size):
+        """Source column and row of every pixel of the frame scaled to size, exactly as transform.scale picks them."""
+        if self.scale_maps is None or self.scale_maps[0] != size:
+            maps = []
+            for length, new_length in zip(self.native_size, size):
+                line = pygame.Surface((length, 1), 0, 32)
+                pygame.surfarray.pixels2d(line)[:, 0] = np.arange(length)
+                maps.append(pygame.surfarray.array2d(pygame.transform.scale(line, (new_length, 1)))[:, 0])
+            self.scale_maps = (size, *maps)
+        return self.scale_maps[1:]
+
+    def present_rects(self, rects):
+        """Scales only the given native rects into the window and updates just those window areas.
+        Pixel-identical to scale_and_center for the covered area."""
+        if self.window_size != self.screen.get_size():
+            self.update_layout()
+        x, y = self.present_offset
+        map_x, map_y = self.get_scale_maps(self.present_size)
+
+        source = pygame.surfarray.pixels2d(self.scaled_surface)
+        window_rects = []
+        for rect in rects:
+            # Scaled columns / rows that sample the rect
+            x0, x1 = np.searchsorted(map_x, (rect.left, rect.right))
+            y0, y1 = np.searchsorted(map_y, (rect.top, rect.bottom))
+            if x0 == x1 or y0 == y1:
+                continue
+            area = pygame.Surface((x1 - x0, y1 - y0), 0, self.scaled_surface)
+            pygame.surfarray.pixels2d(area)[:] = source[map_x[x0:x1, None], map_y[y0:y1]]
+            window_rects.append(self.screen.blit(area, (x + x0, y + y0)))
+        del source  # Unlock the frame
+        pygame.display.update(window_rects)
+
+    def render_preload_progress(self, screen):
+        """Thin bar along the bottom while the next level is still loading."""
+        if self.preload_level_id is None or not self.preload_jobs:
+            return
+        done = sum(job.done for job in self.preload_jobs)
+        width = screen.get_width() * done // len(self.preload_jobs)
+        pygame.draw.rect(screen, (90, 90, 90), (0, screen.get_height() - 3, width, 3))
 
     def render_story(self, screen):
         screen.fill((0, 0, 0))
@@ -375,21 +690,74 @@ class GameEngine:
             alpha=alpha
         )
 
-    def scale_and_center(self):
-        win_w, win_h = self.screen.get_size()
+    def update_layout(self):
+        """Recomputes scale and offset for the current window size, reallocates the scaled frame buffer and
+        paints the letterbox bars (they stay untouched until the next resize)."""
+        win_w, win_h = self.window_size = self.screen.get_size()
         scale = min(win_w / self.native_size[0], win_h / self.native_size[1])
-        new_w = int(self.native_size[0] * scale)
-        new_h = int(self.native_size[1] * scale)
-        scaled = pygame.transform.scale(self.scaled_surface, (new_w, new_h))
+        if self.scale_mode == "integer" and scale >= 1:
+            scale = int(scale)
+
+        self.present_scale = scale
+        self.present_size = (int(self.native_size[0] * scale), int(self.native_size[1] * scale))
+        self.present_offset = ((win_w - self.present_size[0]) // 2, (win_h - self.present_size[1]) // 2)
+        if self.present_size == tuple(self.native_size):
+            self.present_buffer = None
+        else:
+            self.present_buffer = pygame.Surface(self.present_size, 0, self.scaled_surface)
 
-        x = (win_w - new_w) // 2
-        y = (win_h - new_h) // 2
         self.screen.fill((0, 0, 0))
-        self.screen.blit(scaled, (x, y))
+
+    def scale_and_center(self):
+        """Scales the frame into the preallocated buffer and blits it into the window."""
+        if self.window_size != self.screen.get_size():
+            self.update_layout()
+
+        if self.present_buffer is None:
+            self.screen.blit(self.scaled_surface, self.present_offset)
+        elif self.scale_mode == "smooth":
+            pygame.transform.smoothscale(self.scaled_surface, self.present_size, self.present_buffer)
+            self.screen.blit(self.present_buffer, self.present_offset)
+        else:
+            pygame.transform.scale(self.scaled_surface, self.present_size, self.present_buffer)
+            self.screen.blit(self.present_buffer, self.present_offset)
 
     def run(self):
+        if self.fixed_timestep:
+            self.run_fixed()
+            return
+
+        profiler = self.profiler
         while True:
             self.clock.tick(self.fps)
-            self.handle_events()
-            self.update()
-            self.render()
\ No newline at end of file
+            with profiler.span("events"):
+                self.handle_events()
+            with profiler.span("update"):
+                self.update()
+            with profiler.span("render"):
+                self.render()
+            profiler.end_frame()
+
+    def run_fixed(self):
+        """Runs the logic at a fixed rate and catches up with several updates per rendered frame."""
+        profiler = self.profiler
+        while True:
+            self.accumulator += self.clock.tick(self.render_fps) / 1000
+            with profiler.span("events"):
+                self.handle_events()
+
+            steps = 0
+            while self.accumulator >= self.dt and steps < self.max_frame_steps:
+                with profiler.span("update"):
+                    self.update()
+                self.accumulator -= self.dt
+                steps += 1
+
+            # Too far behind: drop the backlog instead of spiralling further
+            if self.accumulator >= self.dt:
+                self.accumulator %= self.dt
+
+            self.interpolation = self.accumulator / self.dt
+            with profiler.span("render"):
+                self.render()
+            profiler.end_frame()
\ No newline at end of file
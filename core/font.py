@@ -1,13 +1,88 @@
+import string
+from collections import OrderedDict
+
 import pygame
 
+# Characters pre-rasterized by every glyph atlas, others get added on first use
+GLYPH_CHARSET = string.digits + string.ascii_letters + string.punctuation + " "
+
+
+class GlyphAtlas:
+    def __init__(self, font, color, charset=GLYPH_CHARSET):
+        """All glyphs of one font and colour rasterized once into a single surface.
+        Strings are drawn by blitting glyph sub-rects, so changing text allocates no surfaces."""
+        self.font = font
+        self.color = color
+        self.height = font.get_height()
+        self.surface = None
+        self.areas = {}  # char -> Rect in surface
+        self.advances = {}  # char -> horizontal advance in px
+        self.build(charset)
+
+    def build(self, charset):
+        glyphs = [(char, self.font.render(char, True, self.color)) for char in dict.fromkeys(charset)]
+        width = sum(glyph.get_width() for _, glyph in glyphs)
+        self.surface = pygame.Surface((max(1, width), self.height), pygame.SRCALPHA)
+
+        x = 0
+        self.areas.clear()
+        self.advances.clear()
+        for char, glyph in glyphs:
+            self.surface.blit(glyph, (x, 0))
+            self.areas[char] = pygame.Rect(x, 0, glyph.get_width(), glyph.get_height())
+            self.advances[char] = self.font.size(char)[0]
+            x += glyph.get_width()
+
+    def ensure(self, text):
+        """Rebuilds the atlas if text uses characters it doesn't hold yet."""
+        for char in text:
+            if char not in self.areas:
+                self.build("".join(self.areas) + text)
+                return
+
+    def width(self, text):
+        advances = self.advances
+        return sum(advances[char] for char in text)
+
+    def render(self, surface, text, position, align_center=False, align_right=False, alpha=255):
+        """Draws text at position (top, left/center/right like FontManager.render). Returns the width."""
+        self.ensure(text)
+        width = self.width(text)
+        x, y = position
+        if align_center:
+            x -= width // 2
+        elif align_right:
+            x -= width
+
+        atlas = self.surface
+        atlas.set_alpha(alpha)
+        areas = self.areas
+        advances = self.advances
+        blits = []
+        for char in text:
+            blits.append((atlas, (x, y), areas[char]))
+            x += advances[char]
+        surface.blits(blits, doreturn=False)
+        return width
+
 
 class FontManager:
-    def __init__(self, resolution, base_resolution=(1280, 720)):
+    def __init__(self, resolution, base_resolution=(1280, 720), max_texts=512, max_layouts=256):
         self.resolution = resolution
         self.base_resolution = base_resolution
         self.font_path = "assets/font/font.otf"
         self.font_cache = {}
 
+        # LRU caches of rendered lines (line, font, color) and wrap layouts (text, font, width).
+        # Cached surfaces are shared: alpha is set right before each blit, never baked in.
+        self.max_texts = max_texts
+        self.max_layouts = max_layouts
+        self.text_cache = OrderedDict()
+        self.layout_cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.glyph_atlases = {}  # (font, color) -> GlyphAtlas
+
     def get_scaled_font(self, size):
         """Returns a scaled font based on screen resolution."""
         scale = min(
@@ -42,18 +117,65 @@ class FontManager:
 
         return lines
 
+    def get_lines(self, text, font, max_width):
+        """Cached wrap_text (fonts are cached per size, so the font object stands for its size)."""
+        key = (text, font, max_width)
+        lines = self.layout_cache.get(key)
+        if lines is not None:
+            self.layout_cache.move_to_end(key)
+            self.hits += 1
+            return lines
+
+        self.misses += 1
+        lines = self.layout_cache[key] = tuple(self.wrap_text(text, font, max_width))
+        if len(self.layout_cache) > self.max_layouts:
+            self.layout_cache.popitem(last=False)
+        return lines
+
+    def get_text(self, line, font, color):
+        """Cached font.render of one line."""
+        key = (line, font, tuple(color))
+        rendered = self.text_cache.get(key)
+        if rendered is not None:
+            self.text_cache.move_to_end(key)
+            self.hits += 1
+            return rendered
+
+        self.misses += 1
+        rendered = self.text_cache[key] = font.render(line, True, color)
+        if len(self.text_cache) > self.max_texts:
+            self.text_cache.popitem(last=False)
+        return rendered
+
+    def get_glyph_atlas(self, size, color=(255, 255, 255)):
+        """Returns the glyph atlas of a font size and colour, building it on first use."""
+        font = self.get_scaled_font(size)
+        key = (font, tuple(color))
+        atlas = self.glyph_atlases.get(key)
+        if atlas is None:
+            atlas = self.glyph_atlases[key] = GlyphAtlas(font, color)
+        return atlas
+
+    def render_glyphs(self, surface, text, position, size=20, color=(255, 255, 255),
+                      align_center=False, align_right=False, alpha=255):
+        """Like render for a single line, drawn from the glyph atlas. Meant for text that changes every frame."""
+        return self.get_glyph_atlas(size, color).render(surface, text, position, align_center, align_right, alpha)
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
     def render(self, surface, text, position, size=20, color=(255, 255, 255),
                wrap=False, max_width=None, align_center=False, align_right=False,
                line_height=1.3, alpha=255):
         """Renders text directly to the given surface with optional wrapping & alignment."""
         font = self.get_scaled_font(size)
-        lines = self.wrap_text(text, font, max_width) if wrap and max_width else [text]
+        lines = self.get_lines(text, font, max_width) if wrap and max_width else (text,)
 
         x, y = position
         for line in lines:
-            rendered = font.render(line, True, color)
-            if alpha < 255:
-                rendered.set_alpha(alpha)
+            rendered = self.get_text(line, font, color)
+            rendered.set_alpha(alpha)  # Always set (255, not None: None would turn off per-pixel blending)
             rect = rendered.get_rect()
 
             if align_center:
@@ -71,17 +193,16 @@ class FontManager:
                           wrap=False, max_width=None, line_height=1.3, alpha=255):
         """Renders text to a new surface (for caching)."""
         font = self.get_scaled_font(size)
-        lines = self.wrap_text(text, font, max_width) if wrap and max_width else [text]
+        lines = self.get_lines(text, font, max_width) if wrap and max_width else (text,)
 
-        line_surfaces = [font.render(line, True, color) for line in lines]
+        line_surfaces = [self.get_text(line, font, color) for line in lines]
         max_width_line = max((surf.get_width() for surf in line_surfaces), default=0)
         total_height = int(sum(surf.get_height() for surf in line_surfaces) * line_height)
 
         surface = pygame.Surface((max_width_line, total_height), pygame.SRCALPHA)
         y = 0
         for rendered in line_surfaces:
-            if alpha < 255:
-                rendered.set_alpha(alpha)
+            rendered.set_alpha(alpha)
             surface.blit(rendered, (0, y))
             y += int(rendered.get_height() * line_height)
 
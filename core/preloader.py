@@ -0,0 +1,71 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from core.assets import convert_image, get_image, is_image_cached, store_image
+
+
+class PreloadJob:
+    def __init__(self, future, finish):
+        """A file loading on a worker. finish runs on the main thread once it is in, value holds its result."""
+        self.future = future
+        self.finish = finish
+        self.done = False
+        self.value = None
+
+
+class AssetPreloader:
+    def __init__(self, workers=None):
+        """Loads files on a thread pool (PNG decoding, level parsing). Work that has to happen on the main
+        thread, like convert(), runs when jobs are finished by poll / wait."""
+        self.pool = ThreadPoolExecutor(workers or min(4, os.cpu_count() or 1), thread_name_prefix="preload")
+        self.pending = []
+
+    def submit(self, load, *args, finish=None):
+        """Runs load(*args) on a worker. finish(result) then runs on the main thread, its return is the job value."""
+        job = PreloadJob(self.pool.submit(load, *args), finish)
+        self.pending.append(job)
+        return job
+
+    def image(self, path, alpha=True, cached=True):
+        """Decodes a PNG on a worker. Cached images end up in the shared image cache (see get_image),
+        the others are only converted (for images that get modified, e.g. set_alpha)."""
+        if cached and is_image_cached(path, alpha):
+            job = PreloadJob(None, None)
+            job.done = True
+            job.value = get_image(path, alpha)
+            return job
+        if cached:
+            return self.submit(pygame.image.load, path, finish=lambda image: store_image(path, image, alpha))
+        return self.submit(pygame.image.load, path, finish=lambda image: convert_image(image, alpha))
+
+    def complete(self, job):
+        """Waits for a job and runs its main-thread part. Errors of the worker are raised here."""
+        self.pending.remove(job)
+        value = job.future.result()
+        job.value = job.finish(value) if job.finish else value
+        job.done = True
+
+    def poll(self, budget=0.004):
+        """Finishes ready jobs for up to budget seconds, so slides keep their frame rate.
+        Returns True once nothing is pending."""
+        start = time.perf_counter()
+        for job in [job for job in self.pending if job.future.done()]:
+            self.complete(job)
+            if time.perf_counter() - start > budget:
+                break
+        return not self.pending
+
+    def wait(self, jobs=None):
+        """Blocks until the jobs (default: everything pending, also jobs submitted meanwhile) are finished.
+        Returns their values."""
+        if jobs is None:
+            while self.pending:
+                self.complete(self.pending[0])
+            return []
+        for job in jobs:
+            if not job.done:
+                self.complete(job)
+        return [job.value for job in jobs]
@@ -0,0 +1,101 @@
+import csv
+import json
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+
+class Profiler:
+    def __init__(self, window=300, trace_frames=3600, stats_interval=30):
+        """Collects named timings per frame (perf_counter_ns) and keeps rolling percentiles of them."""
+        self.enabled = True
+        self.window = window  # Frames the percentiles are computed over
+        self.stats_interval = stats_interval  # Frames between percentile refreshes
+
+        self.current = {}  # name -> ns spent in the running frame
+        self.history = {}  # name -> per-frame ns of the last window frames
+        self.trace = deque(maxlen=trace_frames)  # (frame, {name: ns}) for dumps
+        self.frame = 0
+
+        self.stats = {}
+        self.stats_frame = -stats_interval
+
+    def add(self, name, duration_ns):
+        """Adds a measured duration to the running frame. Repeated spans of one frame are summed up."""
+        if self.enabled:
+            self.current[name] = self.current.get(name, 0) + duration_ns
+
+    @contextmanager
+    def span(self, name):
+        """Times the enclosed block as name."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter_ns() - start)
+
+    def end_frame(self):
+        """Closes the running frame and moves its timings into the rolling history."""
+        if not self.enabled:
+            return
+        for name, duration in self.current.items():
+            samples = self.history.get(name)
+            if samples is None:
+                samples = self.history[name] = deque(maxlen=self.window)
+            samples.append(duration)
+        self.trace.append((self.frame, self.current))
+        self.current = {}
+        self.frame += 1
+
+    def get_stats(self):
+        """Returns {name: (p50, p95, p99)} in ms over the rolling window, refreshed every few frames."""
+        if self.frame - self.stats_frame >= self.stats_interval:
+            self.stats_frame = self.frame
+            self.stats = {
+                name: tuple(np.percentile(np.fromiter(samples, dtype=np.int64), (50, 95, 99)) / 1e6)
+                for name, samples in self.history.items() if samples
+            }
+        return self.stats
+
+    def overlay_lines(self, limit=12):
+        """Text lines for the debug overlay, slowest spans (by p95) first."""
+        stats = sorted(self.get_stats().items(), key=lambda item: item[1][1], reverse=True)
+        return [
+            f"{name}: {p50:.2f} / {p95:.2f} / {p99:.2f} ms"
+            for name, (p50, p95, p99) in stats[:limit]
+        ]
+
+    def dump(self, path=None):
+        """Writes the recorded frames to disk (.csv: one row per span, otherwise JSON). Returns the path."""
+        if path is None:
+            path = os.path.join("profiles", time.strftime("profile_%Y%m%d_%H%M%S.json"))
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if path.endswith(".csv"):
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["frame", "span", "ms"])
+                for frame, spans in self.trace:
+                    for name, duration in spans.items():
+                        writer.writerow([frame, name, f"{duration / 1e6:.4f}"])
+        else:
+            self.stats_frame = -self.stats_interval  # Force fresh percentiles
+            summary = {
+                name: {"p50": p50, "p95": p95, "p99": p99}
+                for name, (p50, p95, p99) in self.get_stats().items()
+            }
+            frames = [
+                {"frame": frame, **{name: duration / 1e6 for name, duration in spans.items()}}
+                for frame, spans in self.trace
+            ]
+            with open(path, "w") as f:
+                json.dump({"unit": "ms", "window": self.window, "summary": summary, "frames": frames}, f, indent=1)
+        return path
@@ -0,0 +1,63 @@
+import struct
+
+import numpy as np
+
+# File layout: header, comma separated action names (bit order), one uint16 action bitmask per tick
+MAGIC = b"PDRP"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIH")  # magic, version, level id, seed, tick count, action names length
+
+
+class Replay:
+    def __init__(self, level_id, seed, actions, states=None):
+        """Input of one level attempt: the level, its RNG seed and the action bitmask of every tick."""
+        self.level_id = level_id
+        self.seed = seed
+        self.actions = list(actions)  # Bit i of a state is actions[i]
+        self.states = [] if states is None else list(states)
+        self.position = 0
+
+    def __len__(self):
+        return len(self.states)
+
+    def record(self, state):
+        self.states.append(state)
+
+    def finished(self):
+        return self.position >= len(self.states)
+
+    def next_state(self):
+        """Returns the bitmask of the next tick."""
+        state = self.states[self.position]
+        self.position += 1
+        return state
+
+    def remap(self, actions):
+        """Translates the recorded bits to another action order (e.g. after new actions were added)."""
+        if actions == self.actions:
+            return
+        moves = [(1 << bit, 1 << actions.index(action)) for bit, action in enumerate(self.actions) if action in actions]
+        self.states = [sum(new for old, new in moves if state & old) for state in self.states]
+        self.actions = list(actions)
+
+    def save(self, path):
+        names = ",".join(self.actions).encode()
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.level_id, self.seed, len(self.states), len(names)))
+            f.write(names)
+            f.write(np.asarray(self.states, dtype="<u2").tobytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+
+        magic, version, level_id, seed, ticks, names_length = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a replay file (version {VERSION})")
+
+        offset = HEADER.size
+        actions = data[offset:offset + names_length].decode().split(",")
+        offset += names_length
+        states = np.frombuffer(data, dtype="<u2", count=ticks, offset=offset)
+        return cls(level_id, seed, actions, states.tolist())
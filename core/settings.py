@@ -22,7 +22,8 @@ class Settings:
                 "menu": [pygame.K_ESCAPE, None],
                 "gravity_inverse": [pygame.K_e, pygame.K_g],
                 "heal": [pygame.K_q, None],
-                "debug": [pygame.K_F3, None]
+                "debug": [pygame.K_F3, None],
+                "profile_dump": [pygame.K_F4, None]
             },
             "volume": {
                 "music": 0.5,
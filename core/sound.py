@@ -4,8 +4,11 @@ import json
 from core.settings import Settings
 
 class SoundManager:
-    def __init__(self):
-        pygame.mixer.init()
+    def __init__(self, enabled=True):
+        # Disabled: the mixer is never initialized (headless runs don't init it either, see GameEngine)
+        self.enabled = enabled
+        if enabled:
+            pygame.mixer.init()
         self.settings = Settings()
         self.music_volume = self.settings.get("volume", "music")
         self.sfx_volume = self.settings.get("volume", "sfx")
@@ -20,12 +23,16 @@ class SoundManager:
         return f"assets/sfx/{self.sfx_map[key]}"
 
     def play_music(self):
+        if not self.enabled:
+            return
         pygame.mixer.music.load(self.sound_path("main_theme"))
         pygame.mixer.music.set_volume(self.music_volume * self.volume_factor_music)
         pygame.mixer.music.play(-1)
 
     def set_music_volume(self, volume):
         self.music_volume = volume
+        if not self.enabled:
+            return
         pygame.mixer.music.set_volume(volume * self.volume_factor_music)
 
     def load_sound(self, key):
@@ -37,6 +44,8 @@ class SoundManager:
         return self.loaded_sounds[path]
 
     def play_sfx(self, key):
+        if not self.enabled:
+            return
         sound = self.load_sound(key)
         if sound:
             channel = pygame.mixer.find_channel()
@@ -1,6 +1,6 @@
 import pygame
-import math
 from core.game_data import get_game_data
+from core.assets import get_image, get_scaled_image, has_display
 
 
 class Background:
@@ -10,35 +10,104 @@ class Background:
         self.speed = data.get("speed", 0)
         self.offset = 0
 
-        # Load original image with alpha
-        original_image = pygame.image.load(data["image"]).convert_alpha()
-
-        # Get scale factor from game config
-        scale = get_game_data("background_scale")
-        orig_width, orig_height = original_image.get_size()
-        new_size = (int(orig_width * scale), int(orig_height * scale))
-        self.image = pygame.transform.scale(original_image, new_size)
+        # Scaled by background_scale, shared by every background using the image
+        self.image = get_scaled_image(data["image"], get_game_data("background_scale"))
         self.rect = self.image.get_rect()
+        original = get_image(data["image"])  # Scaling keeps the alpha values, the small original is quicker to check
+        self.opaque = pygame.mask.from_surface(original, 254).count() == original.get_width() * original.get_height()
+
+        # Image pre-tiled to cover the screen from any offset, built for the screen size on first render
+        self.strip = None
+        self.over_black = False  # Bottom layer: the strip is composed over the black screen and drawn opaque
+
+    def build_strip(self, screen_size):
+        """Tiles the image once over screen width + one image width (cropped to the screen height)."""
+        iw, ih = self.rect.size
+        sw, sh = screen_size
+        tiles = sw // iw + 2
+        if self.over_black:
+            strip = pygame.Surface((tiles * iw, min(ih, sh)))
+            strip.fill((0, 0, 0))
+        else:
+            strip = pygame.Surface((tiles * iw, min(ih, sh)), pygame.SRCALPHA)
+        strip.blits([(self.image, (i * iw, 0)) for i in range(tiles)], doreturn=False)
+        if (self.opaque or self.over_black) and has_display():
+            strip = strip.convert()  # Nothing to blend, plain copies are faster
+        self.strip = strip
+
+    def tile(self, surface):
+        """Draws the image tiled over the surface, the way static layers are placed."""
+        iw = self.rect.w
+        surface.blits([(self.image, (i * iw, 0)) for i in range(-1, surface.get_width() // iw + 2)], doreturn=False)
 
     def render(self, screen, camera):
         """Renders the background horizontally."""
-        iw, ih = self.rect.size
-        sw, sh = screen.get_size()
+        iw = self.rect.w
+        if self.strip is None or self.strip.get_width() < screen.get_width() + iw:
+            self.build_strip(screen.get_size())
 
         if self.type == "static":
-            for i in range(-1, sw // iw + 2):
-                screen.blit(self.image, (i * iw, 0))
+            screen.blit(self.strip, (-iw, 0))
 
         elif self.type == "follow_camera":
             if not camera:
                 return
-            cam_x = -camera.camera.x * self.speed
+            cam_x = -camera.offset_x * self.speed
             base_x = int(cam_x % iw)
-
-            for i in range(-1, sw // iw + 2):
-                screen.blit(self.image, (base_x + i * iw, 0))
+            screen.blit(self.strip, (base_x - iw, 0))
 
         elif self.type == "scroll":
             self.offset = (self.offset + self.speed) % iw
-            for i in range(-1, sw // iw + 2):
-                screen.blit(self.image, (-self.offset + i * iw, 0))
+            # Two blits keep the placement of the old per-tile loop: positions left of 0 round towards 0
+            x = -self.offset
+            screen.blit(self.strip, (int(x) - iw, 0), (0, 0, 2 * iw, self.strip.get_height()))
+            screen.blit(self.strip, (int(x + iw), 0))
+
+
+class BackgroundCompositor:
+    def __init__(self, layers):
+        """Background layers (data back to front). Runs of static layers are flattened into one surface,
+        moving layers draw their pre-tiled strip. The screen is expected to be cleared to black below."""
+        self.layers = [Background(layer) for layer in layers]
+        self.screen_size = None
+        self.passes = []  # Flattened static Surfaces and moving Backgrounds, back to front
+
+    def build(self, screen_size):
+        self.screen_size = screen_size
+        self.passes = []
+        group = []
+        for layer in self.layers + [None]:
+            if layer is not None and layer.type == "static":
+                group.append(layer)
+                continue
+
+            if group:
+                if not self.passes:
+                    # Bottom run: composed over the black screen, nothing below it shows through
+                    flat = pygame.Surface(screen_size)
+                    flat.fill((0, 0, 0))
+                    for static in group:
+                        static.tile(flat)
+                    if has_display():
+                        flat = flat.convert()
+                else:
+                    flat = pygame.Surface(screen_size, pygame.SRCALPHA)
+                    for static in group:
+                        static.tile(flat)
+                self.passes.append(flat)
+                group = []
+            if layer is not None:
+                # Follow layers tile without overlaps, so at the bottom they can be composed over black up front
+                layer.over_black = not self.passes and layer.type == "follow_camera"
+                layer.build_strip(screen_size)
+                self.passes.append(layer)
+
+    def render(self, screen, camera):
+        if self.screen_size != screen.get_size():
+            self.build(screen.get_size())
+
+        for layer in self.passes:
+            if isinstance(layer, Background):
+                layer.render(screen, camera)
+            else:
+                screen.blit(layer, (0, 0))
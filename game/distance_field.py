@@ -0,0 +1,234 @@
+import numpy as np
+
+UNREACHABLE = 1000  # Value of walls and cells out of range, as read by Drone.smart_chase
+OUTSIDE = np.iinfo(np.int16).max  # Padding around the map, never chosen as a flow target
+
+# Flow directions (dx, dy), in the order Drone.smart_chase used to scan them
+DIRECTIONS = ((-1, 0), (-1, -1), (0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1))
+
+
+class DistanceField:
+    def __init__(self, walkable):
+        """4-connected BFS distance map over a [y, x] walkable mask, computed ring by ring with NumPy."""
+        self.walkable = walkable
+        self.height, self.width = walkable.shape
+
+        # Buffers are allocated once and reused by every compute().
+        # distances is the inner view of a padded array, so neighbour lookups never leave the buffer.
+        self.padded = np.full((self.height + 2, self.width + 2), OUTSIDE, dtype=np.int16)
+        self.distances = self.padded[1:-1, 1:-1]
+        self.distances[...] = UNREACHABLE
+        self.visited = np.zeros((self.height, self.width), dtype=bool)
+        self.frontier = np.zeros((self.height, self.width), dtype=bool)
+        self.next_frontier = np.zeros((self.height, self.width), dtype=bool)
+        self.window = None  # (y0, y1, x0, x1) that may hold distances
+
+        # Flow field: index into DIRECTIONS per cell, -1 = no direction
+        self.flow = np.full((self.height, self.width), -1, dtype=np.int8)
+        # True where one of the 8 neighbours is a wall or out of range
+        self.near_wall = np.ones((self.height, self.width), dtype=bool)
+        self.flow_window = None
+        self.flow_dirty = False
+
+        self.source = None
+        self.max_distance = 0
+
+        # Stats for the debug overlay
+        self.full_builds = 0
+        self.incremental_updates = 0
+
+    @property
+    def mp(self):
+        """Distances indexed as mp[x][y] (view, no copy)."""
+        return self.distances.T
+
+    def reset(self):
+        """Marks the area touched by the last compute() as unreachable again."""
+        if self.window is not None:
+            y0, y1, x0, x1 = self.window
+            self.distances[y0:y1, x0:x1] = UNREACHABLE
+            self.window = None
+        self.source = None
+        self.flow_dirty = True
+
+    def reach_window(self, x, y, max_distance):
+        """Returns the (y0, y1, x0, x1) box holding every cell closer than max_distance to (x, y)."""
+        reach = max_distance - 1
+        return (max(0, y - reach), min(self.height, y + reach + 1),
+                max(0, x - reach), min(self.width, x + reach + 1))
+
+    def update_source(self, x, y, max_distance):
+        """Moves the source to (x, y). Repairs the field when it is a one-tile step, rebuilds otherwise."""
+        if not self.move_source(x, y, max_distance):
+            self.compute(x, y, max_distance)
+
+    def compute(self, start_x, start_y, max_distance):
+        """Fills distances < max_distance from the start tile. Everything else stays UNREACHABLE."""
+        self.reset()
+        self.max_distance = max_distance
+
+        if (start_x < 0 or start_y < 0 or
+                start_x >= self.width or start_y >= self.height or
+                max_distance <= 0 or not self.walkable[start_y, start_x]):
+            return
+
+        self.full_builds += 1
+        self.window = self.reach_window(start_x, start_y, max_distance)
+        self.source = (start_x, start_y)
+
+        frontier = self.frontier
+        next_frontier = self.next_frontier
+        visited = self.visited
+        y0, y1, x0, x1 = self.window
+        visited[y0:y1, x0:x1] = False
+        frontier[y0:y1, x0:x1] = False
+        frontier[start_y, start_x] = True
+
+        for dist in range(max_distance):
+            # Ring dist lies within dist steps of the start, so only the box one step larger is touched
+            box = self.box_around(start_x, start_y, dist + 1)
+            ring = frontier[box]
+            self.distances[box][ring] = dist
+            visited[box] |= ring
+            if dist == max_distance - 1:
+                break
+
+            next_ring = next_frontier[box]
+            self.spread(ring, next_ring)
+            next_ring &= self.walkable[box]
+            next_ring &= ~visited[box]
+            ring[...] = False
+            if not next_ring.any():
+                break
+            frontier, next_frontier = next_frontier, frontier
+
+        next_frontier[y0:y1, x0:x1] = False
+        frontier[y0:y1, x0:x1] = False
+
+    def move_source(self, x, y, max_distance):
+        """Incremental update for a source step to a 4-neighbour. Returns False if a rebuild is needed.
+
+        On a grid every distance changes by exactly one: cells whose shortest path runs through the
+        new source (its cone in the BFS order) get one closer, every other reached cell one further."""
+        if self.source is None or max_distance != self.max_distance or max_distance < 2:
+            return False
+        old_x, old_y = self.source
+        if abs(x - old_x) + abs(y - old_y) != 1:
+            return False
+        if not (0 <= x < self.width and 0 <= y < self.height) or not self.walkable[y, x]:
+            return False
+
+        distances = self.distances
+        y0, y1, x0, x1 = self.window
+        ny0, ny1, nx0, nx1 = self.reach_window(x, y, max_distance)
+
+        # Cone: grow from the new source while the old distances keep rising by one per step
+        cone = self.frontier
+        ring = self.visited
+        next_ring = self.next_frontier
+        ring[ny0:ny1, nx0:nx1] = False
+        cone[y, x] = True
+        ring[y, x] = True
+        for step in range(1, max_distance - 1):
+            # The next ring lies step tiles from the new source
+            box = self.box_around(x, y, step)
+            grown = next_ring[box]
+            self.spread(ring[box], grown)
+            grown &= distances[box] == step + 1
+            ring[box] = grown
+            grown[...] = False
+            if not ring[box].any():
+                break
+            cone[box] |= ring[box]
+
+        # Every reached cell moves one further, the cone one closer
+        old_window = distances[y0:y1, x0:x1]
+        old_window[old_window != UNREACHABLE] += 1
+        old_window[cone[y0:y1, x0:x1]] -= 2
+        old_window[old_window == max_distance] = UNREACHABLE  # Stepped out of range
+
+        # Cells that just came into range sit next to the new outermost ring
+        self.window = (ny0, ny1, nx0, nx1)
+        new_window = distances[ny0:ny1, nx0:nx1]
+        edge = ring[ny0:ny1, nx0:nx1]
+        edge[...] = False
+        self.spread(new_window == max_distance - 2, edge)
+        edge &= self.walkable[ny0:ny1, nx0:nx1]
+        edge &= new_window == UNREACHABLE
+        new_window[edge] = max_distance - 1
+
+        cone[y0:y1, x0:x1] = False
+
+        self.source = (x, y)
+        self.flow_dirty = True
+        self.incremental_updates += 1
+        return True
+
+    def box_around(self, x, y, radius):
+        """Slices of the grid box within radius tiles of (x, y)."""
+        return (slice(max(0, y - radius), min(self.height, y + radius + 1)),
+                slice(max(0, x - radius), min(self.width, x + radius + 1)))
+
+    @staticmethod
+    def spread(mask, out):
+        """ORs mask shifted one cell in each of the 4 directions into out."""
+        out[1:, :] |= mask[:-1, :]
+        out[:-1, :] |= mask[1:, :]
+        out[:, 1:] |= mask[:, :-1]
+        out[:, :-1] |= mask[:, 1:]
+
+    def update_flow(self):
+        """Recomputes the direction of the lowest neighbour for every cell in range."""
+        if self.flow_window is not None:
+            y0, y1, x0, x1 = self.flow_window
+            self.flow[y0:y1, x0:x1] = -1
+            self.near_wall[y0:y1, x0:x1] = True
+        self.flow_dirty = False
+        if self.window is None:
+            self.flow_window = None
+            return
+
+        # One extra ring, so cells bordering the range get their near_wall flag too
+        y0, y1, x0, x1 = self.window
+        y0, y1, x0, x1 = max(0, y0 - 1), min(self.height, y1 + 1), max(0, x0 - 1), min(self.width, x1 + 1)
+        self.flow_window = (y0, y1, x0, x1)
+
+        def neighbour(dx, dy):
+            return self.padded[y0 + 1 + dy:y1 + 1 + dy, x0 + 1 + dx:x1 + 1 + dx]
+
+        best = np.full((y1 - y0, x1 - x0), OUTSIDE, dtype=np.int16)
+        best_index = np.full((y1 - y0, x1 - x0), -1, dtype=np.int8)
+        near_wall = self.near_wall[y0:y1, x0:x1]
+        near_wall[...] = False
+        for index, (dx, dy) in enumerate(DIRECTIONS):
+            values = neighbour(dx, dy)
+            near_wall |= values == UNREACHABLE
+            better = values < best
+            if dx and dy:
+                # No corner cutting: both orthogonal neighbours must be open
+                better &= neighbour(dx, 0) != UNREACHABLE
+                better &= neighbour(0, dy) != UNREACHABLE
+            best[better] = values[better]
+            best_index[better] = index
+
+        flow = self.flow[y0:y1, x0:x1]
+        reached = self.distances[y0:y1, x0:x1] != UNREACHABLE
+        flow[reached] = best_index[reached]
+
+    def direction_at(self, x, y):
+        """Returns the (dx, dy) step towards the source from tile (x, y), or None outside the field."""
+        if self.flow_dirty:
+            self.update_flow()
+        if 0 <= x < self.width and 0 <= y < self.height:
+            index = self.flow[y, x]
+            if index >= 0:
+                return DIRECTIONS[index]
+        return None
+
+    def is_near_wall(self, x, y):
+        """True if one of the 8 tiles around (x, y) is a wall or out of range."""
+        if self.flow_dirty:
+            self.update_flow()
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return bool(self.near_wall[y, x])
+        return True
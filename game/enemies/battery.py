@@ -1,5 +1,4 @@
 import pygame
-import random
 from game.enemies.enemy_registry import register_enemy
 from game.entities import Entity
 
@@ -27,9 +26,9 @@ class Battery(Entity):
         self.playing_explode_anim = False
 
         # Timers
-        self.idle_timer = random.randint(30, 60)
-        self.patrol_timer = random.randint(60, 120)
-        self.patrol_dir = random.choice([-1, 1])
+        self.idle_timer = self.level.rng.randint(30, 60)
+        self.patrol_timer = self.level.rng.randint(60, 120)
+        self.patrol_dir = self.level.rng.choice([-1, 1])
 
 
     def update(self, level, dt):
@@ -63,9 +62,9 @@ class Battery(Entity):
                 self.ai_state = "chase"
             elif self.idle_timer <= 0:
                 self.ai_state = "patrol"
-                self.patrol_timer = random.randint(60, 120)
-                self.patrol_dir = random.choice([-1, 1])
-                self.idle_timer = random.randint(30, 60)
+                self.patrol_timer = self.level.rng.randint(60, 120)
+                self.patrol_dir = self.level.rng.choice([-1, 1])
+                self.idle_timer = self.level.rng.randint(30, 60)
 
         elif self.ai_state == "patrol":
             self.set_state("run")
@@ -122,19 +121,18 @@ class Battery(Entity):
         if self.exploded:
             return
 
-        for entity in [self.player] + list(self.level.enemies):
+        for entity in self.level.query_entities_radius(self.rect.center, self.explosion_radius):
             if entity == self or type(entity).__name__ == "Neuros":
                 continue
-            if pygame.Vector2(self.rect.center).distance_to(entity.rect.center) <= self.explosion_radius:
-                if hasattr(entity, "hit"):
-                    entity.hit(self)
+            if hasattr(entity, "hit"):
+                entity.hit(self)
 
         self.exploded = True
 
     def detect_wall_ahead(self):
         offset = self.rect.width if self.facing_right else -1
         probe = self.rect.move(offset, 0)
-        return any(tile.rect.colliderect(probe) for tile in self.level.get_solid_tiles_near(self))
+        return bool(self.level.query_solids(probe))
 
     def attack(self):
         pass  # Overridden: explosion handles damage
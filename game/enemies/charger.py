@@ -1,5 +1,4 @@
 import pygame
-import random
 
 from game.enemies.enemy_registry import register_enemy
 from game.entities import Entity
@@ -29,12 +28,12 @@ class Charger(Entity):
         self.attack_windup_timer = 0
         self.charge_timer = 0
         self.charge_cooldown = 0
-        self.idle_timer = random.randint(30, 60)
-        self.patrol_timer = random.randint(60, 120)
+        self.idle_timer = self.level.rng.randint(30, 60)
+        self.patrol_timer = self.level.rng.randint(60, 120)
 
         # Patrol
-        self.patrol_dir = random.choice([-1, 1])
-        self.patrol_speed_variation = random.uniform(0.8, 1.2)
+        self.patrol_dir = self.level.rng.choice([-1, 1])
+        self.patrol_speed_variation = self.level.rng.uniform(0.8, 1.2)
 
     def update(self, level, dt):
         if self.is_dying:
@@ -68,13 +67,13 @@ class Charger(Entity):
                             self.face_player()
                     else:
                         self.ai_state = "patrol"
-                        self.patrol_timer = random.randint(60, 120)
+                        self.patrol_timer = self.level.rng.randint(60, 120)
                         self.patrol_dir = 1 if self.facing_right else -1
                         if not self.is_direction_safe(level, "right" if self.facing_right else "left"):
                             self.patrol_dir *= -1
                             self.facing_right = not self.facing_right
-                        self.patrol_speed_variation = random.uniform(0.8, 1.2)
-                        self.idle_timer = random.randint(30, 60)
+                        self.patrol_speed_variation = self.level.rng.uniform(0.8, 1.2)
+                        self.idle_timer = self.level.rng.randint(30, 60)
 
             case "patrol":
                 self.set_state("run")
@@ -178,15 +177,14 @@ class Charger(Entity):
         pos = start
         for _ in range(steps):
             pos += direction
-            tile = self.level.get_tile_at(pos.x, pos.y)
-            if tile and getattr(tile, "solid", False):
+            if self.level.is_solid_at(pos.x, pos.y):
                 return False
         return True
 
     #def detect_wall_ahead(self):
     #    offset = self.rect.width if self.facing_right else -1
     #    probe = self.rect.move(offset, 0)
-    #    return any(tile.rect.colliderect(probe) for tile in self.level.get_solid_tiles_near(self))
+    #    return bool(self.level.query_solids(probe))
 
     def face_player(self):
         self.facing_right = self.rect.centerx < self.player.rect.centerx
@@ -1,19 +1,21 @@
 import pygame
+from core.assets import load_image
 
 _death_frames = None
 
 def get_death_frames(tile_size=32, scale=1.0):
     global _death_frames
     if _death_frames is None:
-        sheet = pygame.image.load("assets/characters/death_animation.png").convert_alpha()
+        sheet = load_image("assets/characters/death_animation.png")
         scaled_size = int(tile_size * scale)
-        _death_frames = []
+        frames = []
         frames_amount = sheet.get_width() // tile_size
 
         for col in range(frames_amount):
             x, y = col * tile_size, 0
             frame = sheet.subsurface((x, y, tile_size, tile_size))
             frame = pygame.transform.scale(frame, (scaled_size, scaled_size))
-            _death_frames.append(frame)
+            frames.append(frame)
+        _death_frames = tuple(frames)  # Shared by every entity, see core.assets.get_flipped
 
     return _death_frames
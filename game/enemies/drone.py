@@ -2,6 +2,8 @@ import math
 import pygame
 from game.enemies.enemy_registry import register_enemy
 from game.entities import Entity
+from core.assets import get_flipped, get_rotation_cache
+from core.game_data import get_game_data
 
 @register_enemy("drone")
 class Drone(Entity):
@@ -19,6 +21,8 @@ class Drone(Entity):
         self.direction = pygame.Vector2(0, 0)
         self.smoothing = 0.2
         self.rotation_angle = 0
+        # Tilted frames, shared by all drones using this sprite sheet
+        self.rotation_cache = get_rotation_cache(self.animations.sprite_path, get_game_data().get("drone_rotation_step", 1))
 
         # Attack logic
         self.charge_cooldown = 0
@@ -71,20 +75,11 @@ class Drone(Entity):
         pass
 
     def smart_chase(self, dt):
-
-        directions = [(-1, 0, 0), (-1, -1, 1), (0, -1, 0), (1, -1, 1), (1, 0, 0), (1, 1, 1), (0, 1, 0), (-1, 1, 1)]
-        best_value = float('inf')
+        field = self.level.distance_field
+        tile_size = self.level.tile_size
         best_target = None
 
-        wall = False
-        for index, direc in enumerate(directions):
-            gx = (self.rect.centerx // 32) + direc[0]
-            gy = (self.rect.centery // 32) + direc[1]
-
-            if 0 <= gx < self.level.grid_width and 0 <= gy < self.level.grid_height:
-                if self.level.mp[gx][gy] == 1000:
-                    wall = True
-                    break
+        wall = field.is_near_wall(self.rect.centerx // tile_size, self.rect.centery // tile_size)
         
         if wall:
             corner = self.rect.topleft
@@ -111,25 +106,10 @@ class Drone(Entity):
                     tmp = self.level.mp[x][y]
                     corner = [x, y]
 
-        for index, direc in enumerate(directions):
-            dx = direc[0]
-            dy = direc[1]
-            cnr = direc[2]
-            
-            gx = corner[0] + dx
-            gy = corner[1] + dy
-
-            if 0 <= gx < self.level.grid_width and 0 <= gy < self.level.grid_height:
-                if cnr == 1:    #Falls diagonal
-                    if (self.level.mp[corner[0] + directions[(index-1)%8][0]][corner[1] + directions[(index-1)%8][1]] == 1000
-                    or
-                    self.level.mp[corner[0] + directions[(index+1)%8][0]][corner[1] + directions[(index+1)%8][1]] == 1000):
-                        continue
-                    
-                val = self.level.mp[gx][gy]
-                if val < best_value:
-                    best_value = val
-                    best_target = (gx, gy)
+        # Step down the precomputed flow field from the chosen corner
+        step = field.direction_at(corner[0], corner[1])
+        if step:
+            best_target = (corner[0] + step[0], corner[1] + step[1])
 
         if best_target:
             # Center of the target tile
@@ -159,11 +139,8 @@ class Drone(Entity):
     def render(self, screen, camera, debug_overlay=False):
         """Render the drone with visual rotation, but keep hitbox unchanged."""
         if self.is_dying:
-            frame = self.death_frames[self.sprite_index % len(self.death_frames)]
-            if not self.facing_right:
-                frame = pygame.transform.flip(frame, True, False)
-            if self.is_flipped:
-                frame = pygame.transform.flip(frame, False, True)
+            frames = get_flipped(self.death_frames, not self.facing_right, self.is_flipped)
+            frame = frames[self.sprite_index % len(frames)]
 
             render_pos = camera.apply(self)
             screen.blit(frame, (render_pos[0] + self.render_offset[0], render_pos[1] + self.render_offset[1]))
@@ -172,8 +149,8 @@ class Drone(Entity):
         render_pos = camera.apply(self)
         image = self.image
 
-        # Rotate only the image
-        rotated_image = pygame.transform.rotate(image, self.rotation_angle)
+        # Rotate only the image (cached per frame, orientation and angle bucket)
+        rotated_image = self.rotation_cache.get(image, self.rotation_angle)
         rotated_rect = rotated_image.get_rect(center=(render_pos[0] + self.render_offset[0] + image.get_width() // 2,
                                                       render_pos[1] + self.render_offset[1] + image.get_height() // 2))
 
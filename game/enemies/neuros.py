@@ -1,5 +1,4 @@
 import pygame
-import random
 import math
 
 from game.entities import Entity
@@ -156,7 +155,7 @@ class Neuros(Entity):
 
     # === Phase 1 ===
     def phase_1(self, dt):
-        rnd_phase = random.randint(0, 100)
+        rnd_phase = self.level.rng.randint(0, 100)
         if self.action_cooldown == 0 and self.walking == 0:
             if self.between(0, 16, rnd_phase):
                 self.speak("Analyzing human behavior...")
@@ -191,7 +190,7 @@ class Neuros(Entity):
 
     # === Phase 2 ===
     def phase_2(self, dt):
-        rnd_phase = random.randint(0, 100)
+        rnd_phase = self.level.rng.randint(0, 100)
         if self.action_cooldown == 0 and self.walking == 0:
             if self.between(0, 12, rnd_phase):
                 self.speak("Analyzing human behavior...")
@@ -235,7 +234,7 @@ class Neuros(Entity):
 
     # === Phase 3 ===
     def phase_3(self, dt):
-        rnd_phase = random.randint(0, 100)
+        rnd_phase = self.level.rng.randint(0, 100)
         if self.action_cooldown == 0 and self.walking == 0:
             if self.between(0, 3, rnd_phase):
                 self.speak("Analyzing human behavior...")
@@ -309,32 +308,32 @@ class Neuros(Entity):
     def summon_drones(self):
         self.set_state("summon_enemy")
         if len(self.minions) < 5:
-            pos = (self.rect.centerx + random.randint(-20, 20), self.rect.y)
+            pos = (self.rect.centerx + self.level.rng.randint(-20, 20), self.rect.y)
             drone = Drone(pos[0], pos[1], "assets/characters/drone.png", "assets/characters/drone.json",
                           self.player, self.level, self.sound_manager)
             self.minions.append(drone)
-            self.level.enemies.add(drone)
+            self.level.add_enemy(drone)
             self.speak("Deploying additional unit.")
         
     def summon_batteries(self, amt):
         self.set_state("summon_enemy")
         if len(self.minions) < 8:
             for a in range(amt):
-                pos = [self.rect.centerx + random.randint(-40, 40), self.rect.centery]
+                pos = [self.rect.centerx + self.level.rng.randint(-40, 40), self.rect.centery]
                 battery = Battery(pos[0], pos[1], "assets/characters/battery.png", "assets/characters/battery.json",
                                 self.player, self.level, self.sound_manager)
                 self.minions.append(battery)
-                self.level.enemies.add(battery)
+                self.level.add_enemy(battery)
                 self.speak("Deploying destruction units.")
 
     def deploy_emp_radars(self):
         self.set_state("summon_enemy")
         self.sound_manager.play_sfx("glitch")
         if len(self.minions) < 6:
-            pos = (self.rect.centerx + random.randint(-40, 40), self.rect.top + 20)
+            pos = (self.rect.centerx + self.level.rng.randint(-40, 40), self.rect.top + 20)
             radar = EMP_Radar(pos[0], pos[1], self.level, self.player)
             self.minions.append(radar)
-            self.level.enemies.add(radar)
+            self.level.add_enemy(radar)
             self.speak("EMP field active.")
 
     def aim(self):
@@ -357,7 +356,7 @@ class Neuros(Entity):
         for i in range(0, 2000):
             x = math.floor((self.beam_start[0] + x_rise * i * 0.1))
             y = math.floor((self.beam_start[1] + y_rise * i * 0.1))
-            if self.level.get_tile_at(x,y):
+            if self.level.is_solid_at(x, y):
                 return [x, y]
         return self.player.rect.center
 
@@ -369,8 +368,8 @@ class Neuros(Entity):
         self.shield_timer = 5.0
 
     def world_hack(self):
-        effect = random.choice(["gravity", "controls"])
-        #effect = random.choice(["gravity", "controls", "glitch"])
+        effect = self.level.rng.choice(["gravity", "controls"])
+        #effect = self.level.rng.choice(["gravity", "controls", "glitch"])
         if effect == "gravity":
             self.level.flip_gravity()
             self.speak("Gravity systems compromised.")
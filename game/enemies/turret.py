@@ -2,6 +2,8 @@ import pygame
 import math
 from game.enemies.enemy_registry import register_enemy
 from game.entities import Entity
+from core.assets import get_flipped, get_image, get_rotation_cache
+from core.game_data import get_game_data
 
 
 @register_enemy("turret")
@@ -26,29 +28,13 @@ class Turret(Entity):
         self.rotation_speed_deg = 3
 
         # Preload assets
-        self.turret_base = pygame.image.load("assets/characters/turret_base.png").convert_alpha()
+        self.turret_base = get_image("assets/characters/turret_base.png")
         self.rect.y -= 0.28 * self.level.tile_size
 
-        # Cache rotated sprites
-        self.sprite_cache = {}
-        self.precompute_rotated_sprites()
-
-    def precompute_rotated_sprites(self):
-        """Precompute rotated sprites to avoid real-time rotation"""
-        for state in self.sprites:
-            self.sprite_cache[state] = []
-            for frame in self.sprites[state]:
-                rotations = {}
-                # Cache at 15-degree increments for less memory usage
-                for angle in range(0, 360, 5):
-                    rotated = pygame.transform.rotate(frame, angle)
-                    rotations[angle] = rotated
-                self.sprite_cache[state].append(rotations)
-
-    def get_cached_sprite(self, state, frame_idx, angle):
-        """Retrieve nearest precomputed sprite"""
-        nearest_angle = round(angle / 5) * 5 % 360
-        return self.sprite_cache[state][frame_idx][nearest_angle]
+        # Rotated gun frames, shared by all turrets and filled on first use of each angle
+        self.rotation_cache = get_rotation_cache(
+            self.animations.sprite_path, 5, get_game_data().get("turret_rotation_budget_kb", 8192) * 1024
+        )
 
     def flip_gravity(self):
         pass
@@ -151,8 +137,7 @@ class Turret(Entity):
         current_distance = 0
         while current_distance < max_distance:
             point = origin + direction * current_distance
-            tile = self.level.get_tile_at(point.x, point.y)
-            if tile and tile.solid:
+            if self.level.is_solid_at(point.x, point.y):
                 return point.x, point.y
             current_distance += step
 
@@ -174,18 +159,14 @@ class Turret(Entity):
             point = start + direction * (i * step_size)
             if point.distance_to(start) > distance:
                 break
-            tile = self.level.get_tile_at(point.x, point.y)
-            if tile and tile.solid:
+            if self.level.is_solid_at(point.x, point.y):
                 return False
         return True
 
     def render(self, screen, camera, debug_overlay=False):
         if self.is_dying:
-            frame = self.death_frames[self.sprite_index % len(self.death_frames)]
-            if not self.facing_right:
-                frame = pygame.transform.flip(frame, True, False)
-            if self.is_flipped:
-                frame = pygame.transform.flip(frame, False, True)
+            frames = get_flipped(self.death_frames, not self.facing_right, self.is_flipped)
+            frame = frames[self.sprite_index % len(frames)]
 
             render_pos = camera.apply(self)
             screen.blit(frame, (render_pos[0] + self.render_offset[0], render_pos[1] + self.render_offset[1]))
@@ -206,10 +187,7 @@ class Turret(Entity):
         if angle > 90 and angle < 270:
             angle = (450 - (angle - 90)) % 360
 
-        rotated = self.get_cached_sprite(state, frame_idx, angle)
-
-        if not self.facing_right:
-            rotated = pygame.transform.flip(rotated, True, False)
+        rotated = self.rotation_cache.get(self.sprites[state][frame_idx], angle, not self.facing_right)
 
         rotated_rect = rotated.get_rect(center=camera.apply(self.rect).center)
         screen.blit(rotated, rotated_rect)
@@ -1,6 +1,7 @@
-import json
+from time import perf_counter_ns
 import pygame
 from game.enemies.death_animation import get_death_frames
+from core.assets import get_animation_set, get_flipped
 
 class Entity(pygame.sprite.Sprite):
     def __init__(self, x, y, sprite_path, json_path, level, sound_manager):
@@ -21,6 +22,7 @@ class Entity(pygame.sprite.Sprite):
         self.health = self.max_health
         self.apply_gravity = True
 
+        self.animations = None  # Shared AnimationSet, frames must not be modified
         self.sprite_data = None
         self.entity_size = [16, 16]
         self.scale = 1.0
@@ -35,6 +37,9 @@ class Entity(pygame.sprite.Sprite):
         width = self.entity_size[0] * self.scale
         height = self.entity_size[1] * self.scale
         self.rect = pygame.Rect(x, y, width, height)
+        # Scratch rects reused by the collision checks every step
+        self.sweep_rect = self.rect.copy()
+        self.feet_rect = self.rect.copy()
 
         # Physics
         self.velocity = pygame.Vector2(0, 0)
@@ -44,6 +49,7 @@ class Entity(pygame.sprite.Sprite):
         self.attacking = False
         self.stunned = False
         self.stun = 0
+        self.prev_pos = None  # Position of the previous simulation step (render interpolation)
 
         # Fallback image (in case sprites are not loaded)
         self.image = pygame.Surface((width, height))
@@ -65,8 +71,7 @@ class Entity(pygame.sprite.Sprite):
 
         # --- 2. Wandprüfung auf Höhe der Mitte ---
         mid_y = self.rect.centery
-        wall_tile = level.get_tile_at(int(front_x), int(mid_y))
-        if wall_tile and getattr(wall_tile, "solid", False):
+        if level.is_solid_at(int(front_x), int(mid_y)):
             return False  # Wand voraus
 
         # --- 3. Bodenprüfung: prüfe 1–2 Blöcke unter dem Fußniveau ---
@@ -76,35 +81,24 @@ class Entity(pygame.sprite.Sprite):
         for i in range(1, 3):  # Prüfe 1 bis 2 Blöcke unterhalb
             offset = i * tile_size
             probe_y = foot_y + offset * (-1 if self.is_flipped else 1)
-            tile = level.get_tile_at(int(front_x), int(probe_y))
-            if tile and getattr(tile, "solid", False):
+            if level.is_solid_at(int(front_x), int(probe_y)):
                 is_ground = True
                 break
         return is_ground
 
     def load_sprite_metadata(self, sprite_path, json_path):
-        """Load metadata like entity_size and scale from the JSON config."""
-        with open(json_path) as f:
-            data = json.load(f)
+        """Load metadata like entity_size and scale from the (cached) JSON config."""
+        self.animations = get_animation_set(sprite_path, json_path)
 
-        self.sprite_data = data
-        self.entity_size = tuple(data.get("entity_size", [16, 16]))
-        self.scale = data.get("entity_scale", 1.0)
-        self.tile_size = data.get("tile_size", 16)
+        self.sprite_data = self.animations.data
+        self.entity_size = self.animations.entity_size
+        self.scale = self.animations.scale
+        self.tile_size = self.animations.tile_size
 
     def load_sprites(self, sprite_path):
-        """Loads animations from a sprite sheet using already-loaded metadata."""
-        sprite_sheet = pygame.image.load(sprite_path).convert_alpha()
-        scaled_size = int(self.tile_size * self.scale)
-
-        for state, frames in self.sprite_data["animations"].items():
-            self.sprites[state] = []
-            for frame in frames:
-                col, row = map(int, frame.split(","))
-                x, y = col * self.tile_size, row * self.tile_size
-                sprite = sprite_sheet.subsurface((x, y, self.tile_size, self.tile_size))
-                sprite = pygame.transform.scale(sprite, (scaled_size, scaled_size))
-                self.sprites[state].append(sprite)
+        """Uses the shared, already scaled animation frames of the sprite sheet."""
+        self.sprites = self.animations.frames
+        scaled_size = self.animations.frame_size
 
         self.image = self.sprites[self.state][0]
 
@@ -148,50 +142,76 @@ class Entity(pygame.sprite.Sprite):
 
     def move(self, level):
         """Moves entity and resolves collisions using sweep-based checks."""
+        start_time = perf_counter_ns()
         self.on_ground = False
 
         # Move horizontally and check for collisions
+        start_x = self.rect.x
         self.rect.x += self.velocity.x
-        self.handle_collisions(level, direction="horizontal")
+        self.handle_collisions(level, "horizontal", start_x)
 
         # Move vertically and check for collisions
+        start_y = self.rect.y
         self.rect.y += self.velocity.y
-        self.handle_collisions(level, direction="vertical")
+        self.handle_collisions(level, "vertical", start_y)
+
+        # Always check for grounding (secondary contact check)
+        self.check_if_grounded(level)
+        level.engine.profiler.add("physics", perf_counter_ns() - start_time)
+
+    def handle_collisions(self, level, direction, start=None):
+        """Handles collisions with solid tiles in the given direction.
+        Queries the area swept since start once, so fast entities can't skip through thin tiles."""
+        rect = self.rect
+        sweep = self.sweep_rect
+        sweep.update(rect)
 
-    def handle_collisions(self, level, direction):
-        """Handles collisions with solid tiles in the given direction."""
         if direction == "horizontal":
-            for tile in level.get_solid_tiles_near(self):
-                if self.rect.colliderect(tile.rect):
-                    if self.velocity.x > 0:  # Moving right
-                        self.rect.right = tile.rect.left
-                    elif self.velocity.x < 0:  # Moving left
-                        self.rect.left = tile.rect.right
-                    self.velocity.x = 0
+            if start is None:
+                start = rect.x
+            sweep.x = min(start, rect.x)
+            sweep.width = rect.width + abs(rect.x - start)
+
+            for tile_rect in level.query_solids(sweep):
+                if self.velocity.x > 0:  # Moving right
+                    passed = start + rect.width <= tile_rect.left < rect.right
+                    if passed or rect.colliderect(tile_rect):
+                        rect.right = tile_rect.left
+                        self.velocity.x = 0
+                        self.hit_edge = True
+                elif self.velocity.x < 0:  # Moving left
+                    passed = rect.left < tile_rect.right <= start
+                    if passed or rect.colliderect(tile_rect):
+                        rect.left = tile_rect.right
+                        self.velocity.x = 0
+                        self.hit_edge = True
+                elif rect.colliderect(tile_rect):
                     self.hit_edge = True
-            if self.rect.left < 0:
-                self.rect.left = 0
+            if rect.left < 0:
+                rect.left = 0
                 self.velocity.x = 0
                 self.hit_edge = True
 
         elif direction == "vertical":
-            for tile in level.get_solid_tiles_near(self):
-                if self.rect.colliderect(tile.rect):
-                    if self.velocity.y > 0:     #Fall
-                        self.rect.bottom = tile.rect.top
+            if start is None:
+                start = rect.y
+            sweep.y = min(start, rect.y)
+            sweep.height = rect.height + abs(rect.y - start)
+
+            for tile_rect in level.query_solids(sweep):
+                if self.velocity.y > 0:     #Fall
+                    if start + rect.height <= tile_rect.top < rect.bottom or rect.colliderect(tile_rect):
+                        rect.bottom = tile_rect.top
                         self.velocity.y = 0
-                    elif self.velocity.y < 0:   #Jump
-                        self.rect.top = tile.rect.bottom
+                elif self.velocity.y < 0:   #Jump
+                    if rect.top < tile_rect.bottom <= start or rect.colliderect(tile_rect):
+                        rect.top = tile_rect.bottom
                         self.velocity.y = 0
 
-        # Always check for grounding (secondary contact check)
-        self.check_if_grounded(level)
-
     def check_if_grounded(self, level):
         """Ensures on_ground is true when standing on something."""
-        self.on_ground = False  # Reset
-
-        feet_rect = self.rect.copy()
+        feet_rect = self.feet_rect
+        feet_rect.update(self.rect)
         buffer = 1  # Slight overlap below feet
 
         if level.gravity > 0:
@@ -199,10 +219,7 @@ class Entity(pygame.sprite.Sprite):
         else:
             feet_rect.y -= buffer
 
-        for tile in level.get_solid_tiles_near(self):
-            if feet_rect.colliderect(tile.rect):
-                self.on_ground = True
-                return
+        self.on_ground = bool(level.query_solids(feet_rect))
 
     def update_animation(self, dt, use_flip=True):
         """Updates the entity's animation safely and efficiently."""
@@ -226,11 +243,7 @@ class Entity(pygame.sprite.Sprite):
         # Apply flipped transformations
         if not use_flip:
             return
-        self.image = frames[self.sprite_index]
-        if not self.facing_right:
-            self.image = pygame.transform.flip(self.image, True, False)
-        if self.is_flipped:
-            self.image = pygame.transform.flip(self.image, False, True)
+        self.image = get_flipped(frames, not self.facing_right, self.is_flipped)[self.sprite_index]
 
     def set_state(self, new_state):
         """Safely switches states and resets animations."""
@@ -244,11 +257,8 @@ class Entity(pygame.sprite.Sprite):
     def render(self, screen, camera, debug_overlay=False):
         """Renders the entity sprite with gravity-aware offset."""
         if self.is_dying:
-            frame = self.death_frames[self.sprite_index % len(self.death_frames)]
-            if not self.facing_right:
-                frame = pygame.transform.flip(frame, True, False)
-            if self.is_flipped:
-                frame = pygame.transform.flip(frame, False, True)
+            frames = get_flipped(self.death_frames, not self.facing_right, self.is_flipped)
+            frame = frames[self.sprite_index % len(frames)]
 
             base_pos = camera.apply(self)
             x = base_pos[0] + self.render_offset[0]
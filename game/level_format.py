@@ -0,0 +1,193 @@
+"""Compiled binary levels: one file per level holding the tile grid, tile metadata, enemies and spawn.
+
+Build step (run from the repository root):
+    python -m game.level_format              # every assets/levels/level_N.json
+    python -m game.level_format 3 4          # selected levels
+    python -m game.level_format 3 --ldtk assets/levels/mapbuidling/test.ldtk   # straight from the LDtk export
+
+Level loads the compiled file when it is up to date with its sources and falls back to JSON otherwise.
+"""
+import argparse
+import glob
+import importlib.util
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+
+import numpy as np
+
+COMPILED_DIR = "assets/levels/compiled"
+ARRAY_GEN_PATH = "assets/levels/mapbuidling/array_gen.py"
+
+# File layout: header, JSON metadata (tile data, enemies, spawn, sources), padding to 2 bytes, uint16 tiles [y, x]
+MAGIC = b"PDLV"
+VERSION = 1
+HEADER = struct.Struct("<4sHHHI")  # magic, version, grid width, grid height, metadata length
+
+
+def level_path(level_number):
+    return f"assets/levels/level_{level_number}.json"
+
+
+def tile_data_path(level_number):
+    return f"assets/tiles/level_{level_number}_data.json"
+
+
+def compiled_path(level_number):
+    return os.path.join(COMPILED_DIR, f"level_{level_number}.lvl")
+
+
+def stamp(path):
+    """[path, mtime_ns, size] of a source file, to detect stale compiled files."""
+    info = os.stat(path)
+    return [path, info.st_mtime_ns, info.st_size]
+
+
+def tiles_to_array(tile_map):
+    """Nested tile lists (rows may be ragged) -> [y, x] uint16 array."""
+    height = len(tile_map)
+    width = max((len(row) for row in tile_map), default=0)
+    tile_ids = np.zeros((height, width), dtype=np.uint16)
+    for y, row in enumerate(tile_map):
+        tile_ids[y, :len(row)] = row
+    return tile_ids
+
+
+def load_json(level_number):
+    """Parses level_N.json and level_N_data.json into the layout returned by load_level_data."""
+    path = level_path(level_number)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Level file {path} not found!")
+
+    with open(tile_data_path(level_number)) as f:
+        tile_data = json.load(f)
+    with open(path) as f:
+        level_data = json.load(f)
+
+    level_data["tile_data"] = tile_data
+    level_data["tiles"] = tiles_to_array(level_data["tiles"])
+    level_data["sources"] = [stamp(path), stamp(tile_data_path(level_number))]
+    return level_data
+
+
+def load_ldtk(ldtk_path, level_number, ldtk_level=None):
+    """Converts a level of the LDtk export with array_gen.ldtk_to_level, tile data from level_N_data.json."""
+    spec = importlib.util.spec_from_file_location("array_gen", ARRAY_GEN_PATH)
+    array_gen = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(array_gen)
+
+    with open(ldtk_path) as f:
+        level_data = array_gen.ldtk_to_level(json.load(f), level_number if ldtk_level is None else ldtk_level)
+    with open(tile_data_path(level_number)) as f:
+        level_data["tile_data"] = json.load(f)
+
+    # time_to_finish is not part of the LDtk export, keep the one of the JSON level if there is one
+    if os.path.exists(level_path(level_number)):
+        with open(level_path(level_number)) as f:
+            level_data["time_to_finish"] = json.load(f).get("time_to_finish", 0)
+
+    level_data["tiles"] = tiles_to_array(level_data["tiles"])
+    level_data["sources"] = [stamp(ldtk_path), stamp(tile_data_path(level_number))]
+    return level_data
+
+
+def write_compiled(level_number, level_data):
+    """Writes level_data (as returned by load_json / load_ldtk) to the compiled file. Returns the path."""
+    tiles = np.ascontiguousarray(level_data["tiles"], dtype="<u2")
+    meta = {key: value for key, value in level_data.items() if key != "tiles"}
+    meta_bytes = json.dumps(meta, separators=(",", ":")).encode()
+    padding = (HEADER.size + len(meta_bytes)) % 2
+
+    path = compiled_path(level_number)
+    os.makedirs(COMPILED_DIR, exist_ok=True)
+    # Written next to the target and swapped in, readers (also preloader threads) never see a partial file
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, tiles.shape[1], tiles.shape[0], len(meta_bytes)))
+            f.write(meta_bytes)
+            f.write(b"\0" * padding)
+            f.write(tiles.tobytes())
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return path
+
+
+def read_compiled(level_number):
+    """Loads the compiled file, or returns None if it is missing, outdated, older than its sources or damaged."""
+    path = compiled_path(level_number)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            magic, version, width, height, meta_length = HEADER.unpack_from(data)
+            if magic != MAGIC or version != VERSION:
+                return None
+
+            offset = HEADER.size
+            level_data = json.loads(data[offset:offset + meta_length])
+            for source, mtime, size in level_data["sources"]:
+                if not os.path.exists(source) or stamp(source)[1:] != [mtime, size]:
+                    return None
+
+            offset += meta_length + (offset + meta_length) % 2
+            # Copied out of the map, the level edits its grid (unknown ids are cleared)
+            tiles = np.frombuffer(data, dtype="<u2", count=width * height, offset=offset)
+            level_data["tiles"] = tiles.reshape(height, width).astype(np.uint16)
+            del tiles  # Release the buffer before the map closes
+    except (OSError, struct.error, ValueError, KeyError, TypeError) as e:
+        # Truncated or corrupt (JSONDecodeError is a ValueError): recompiled from the sources
+        print(f"[WARNING] Ignoring damaged compiled level {path}: {e}")
+        return None
+    return level_data
+
+
+def load_level_data(level_number):
+    """Returns {"tile_data", "tiles" ([y, x] uint16), "enemies", "spawn", "time_to_finish", ...} of a level.
+    Uses the compiled file if it is up to date, otherwise parses the JSON and recompiles it."""
+    level_data = read_compiled(level_number)
+    if level_data is not None:
+        return level_data
+
+    level_data = load_json(level_number)
+    try:
+        write_compiled(level_number, level_data)
+    except OSError as e:
+        print(f"[WARNING] Could not compile level {level_number}: {e}")
+    return level_data
+
+
+def find_levels():
+    """Ids of all assets/levels/level_N.json files, sorted."""
+    ids = []
+    for path in glob.glob("assets/levels/level_*.json"):
+        match = re.fullmatch(r"level_(\d+)\.json", os.path.basename(path))
+        if match:
+            ids.append(int(match.group(1)))
+    return sorted(ids)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile levels into the binary level format")
+    parser.add_argument("levels", type=int, nargs="*", help="level ids (default: every level_N.json)")
+    parser.add_argument("--ldtk", metavar="PATH", help="compile from this LDtk export instead of level_N.json")
+    parser.add_argument("--ldtk-level", type=int, help="LDtk level number, if it differs from the level id")
+    args = parser.parse_args()
+
+    for level_number in args.levels or find_levels():
+        if args.ldtk:
+            level_data = load_ldtk(args.ldtk, level_number, args.ldtk_level)
+        else:
+            level_data = load_json(level_number)
+        path = write_compiled(level_number, level_data)
+        print(f"[INFO] Compiled level {level_number} to {path} ({os.path.getsize(path) // 1024} KB)")
+
+
+if __name__ == "__main__":
+    main()
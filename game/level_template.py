@@ -0,0 +1,133 @@
+import numpy as np
+
+from core.assets import get_image
+from core.game_data import get_game_data
+from game.enemies.enemy_registry import ENEMY_CLASSES
+from game.level_format import load_level_data
+from game.tiles.basic_tile import Tile
+from game.tiles.tiles_register import TILES_CLASSES
+from game.tiles.static_layer import StaticTileLayer
+from game.tiles.tile_atlas import TileAtlas
+
+# Level number -> LevelTemplate, kept for the whole session (retries only build the mutable state)
+_templates = {}
+
+
+class LevelTemplate:
+    def __init__(self, level_number, level_data=None):
+        """Immutable part of a level: tile grids, tile images, static layer and spawn lists.
+        Shared by every Level instance of the number, nothing in here may be modified after building.
+        level_data: result of load_level_data if it was already loaded (e.g. by the preloader)."""
+        self.level_number = level_number
+        if level_data is None:
+            level_data = load_level_data(level_number)
+
+        self.tile_data = level_data["tile_data"]
+        self.tile_size = self.tile_data["tile_size"]
+        self.tile_set = get_image(f"assets/tiles/level_{level_number}_set.png")
+        self.tile_atlas = TileAtlas(self.tile_set, self.tile_size)
+
+        self.spawn = (level_data["spawn"][0] * self.tile_size, level_data["spawn"][1] * self.tile_size)
+        self.time_to_finish = level_data.get("time_to_finish", 0)
+
+        # (class, x, y, enemy type) of every known enemy, in file order
+        self.enemy_spawns = []
+        self.enemies_count = len(level_data.get("enemies", []))
+        for enemy_data in level_data.get("enemies", []):
+            enemy_type = enemy_data["type"]
+            if enemy_type in ENEMY_CLASSES:
+                x, y = enemy_data["x"] * self.tile_size, enemy_data["y"] * self.tile_size
+                self.enemy_spawns.append((ENEMY_CLASSES[enemy_type], x, y, enemy_type))
+
+        # Tiles come as a compact [y, x] array
+        self.tile_ids = level_data["tiles"]
+        self.grid_height, self.grid_width = self.tile_ids.shape
+        self.solid_grid = None
+        self.hitbox_grid = None
+        self.build_tile_arrays()
+        self.walkable = ~self.solid_grid
+
+        # Per used tile id: behaviour tiles become sprites, static ones share an image in the static layer
+        counts = np.bincount(self.tile_ids.ravel())
+        static_images = [None] * len(counts)
+        dynamic = np.zeros(len(counts), dtype=bool)
+        for tile_id in np.nonzero(counts[1:])[0] + 1:
+            tile_info = self.tile_data["tiles"][str(tile_id)]
+            # Every tile is counted here once, spawned tiles look their image up without counting
+            image = self.tile_atlas.get(tile_info["index"], int(counts[tile_id]))
+            if TILES_CLASSES.get(tile_info["type"], Tile).update_required:
+                dynamic[tile_id] = True
+            else:
+                static_images[tile_id] = image
+
+        self.static_layer = StaticTileLayer(
+            self.grid_width * self.tile_size, self.grid_height * self.tile_size, get_game_data("chunk_size"),
+            get_game_data().get("chunk_cache_budget_kb", 65536) * 1024
+        )
+        self.static_layer.set_tiles(self.tile_ids, static_images, self.tile_size)
+
+        # (class, x, y, tile info) of the tiles with behaviour (spikes, moving platforms)
+        self.tile_spawns = []
+        for y, x in zip(*np.nonzero(dynamic[self.tile_ids])):
+            tile_info = self.tile_data["tiles"][str(self.tile_ids[y, x])]
+            tile_class = TILES_CLASSES.get(tile_info["type"], Tile)
+            self.tile_spawns.append((tile_class, int(x) * self.tile_size, int(y) * self.tile_size, tile_info))
+
+        self.width = 0
+        self.height = 0
+        used_columns = np.nonzero(self.tile_ids.any(axis=0))[0]
+        used_rows = np.nonzero(self.tile_ids.any(axis=1))[0]
+        if len(used_columns):
+            self.width = (int(used_columns[-1]) + 1) * self.tile_size
+            self.height = (int(used_rows[-1]) + 1) * self.tile_size
+
+        for array in (self.tile_ids, self.solid_grid, self.hitbox_grid, self.walkable):
+            array.flags.writeable = False
+
+    def build_tile_arrays(self):
+        """Builds per-cell solidity and hitbox arrays from tile ids via per-type lookup tables."""
+        tiles = self.tile_data["tiles"]
+        lut_size = max([int(self.tile_ids.max())] + [int(key) for key in tiles]) + 1
+        known = np.zeros(lut_size, dtype=bool)
+        solid = np.zeros(lut_size, dtype=bool)
+        hitboxes = np.zeros((lut_size, 4), dtype=np.int32)  # offset_x, offset_y, width, height
+
+        for key, tile_info in tiles.items():
+            tile_id = int(key)
+            tile_class = TILES_CLASSES.get(tile_info["type"], Tile)
+            hitbox = tile_info.get("hitbox", {})
+            known[tile_id] = True
+            solid[tile_id] = tile_info["collision_type"] == "solid" and not tile_class.update_required
+            hitboxes[tile_id] = (
+                hitbox.get("offset_x", 0.0) * self.tile_size,
+                hitbox.get("offset_y", 0.0) * self.tile_size,
+                hitbox.get("width", 1.0) * self.tile_size,
+                hitbox.get("height", 1.0) * self.tile_size,
+            )
+        known[0] = False
+
+        self.tile_ids[~known[self.tile_ids]] = 0  # Ids without metadata are skipped like empty cells
+        self.solid_grid = solid[self.tile_ids]
+
+        # World-space hitbox (x, y, w, h) of every cell
+        self.hitbox_grid = hitboxes[self.tile_ids]
+        ys, xs = np.indices(self.tile_ids.shape, dtype=np.int32)
+        self.hitbox_grid[..., 0] += xs * self.tile_size
+        self.hitbox_grid[..., 1] += ys * self.tile_size
+
+
+def get_level_template(level_number, level_data=None):
+    """Returns the cached template of a level, building it on first use (from level_data if given)."""
+    template = _templates.get(level_number)
+    if template is None:
+        template = _templates[level_number] = LevelTemplate(level_number, level_data)
+    return template
+
+
+def has_level_template(level_number):
+    return level_number in _templates
+
+
+def clear_level_templates():
+    """Drops all templates, e.g. after level files changed."""
+    _templates.clear()
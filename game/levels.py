@@ -1,40 +1,60 @@
 import json
-from collections import deque
-from time import time
+from time import perf_counter_ns, time
 
 import pygame
-import os
 import math
-import numpy as np
+import random
 from heapq import heappush, heappop
-from game.enemies.enemy_registry import ENEMY_CLASSES
-from game.tiles.basic_tile import Tile
-from game.tiles.tiles_register import TILES_CLASSES
+from game.spatial_hash import SpatialHash
+from game.distance_field import DistanceField
+from game.level_template import get_level_template
 from game.player import Player  # Import Player
 
+# Enemy class -> profiler span name, built once per class instead of every tick
+_enemy_span_names = {}
+
+
+def enemy_span_name(enemy_class):
+    name = _enemy_span_names.get(enemy_class)
+    if name is None:
+        name = _enemy_span_names[enemy_class] = "enemy " + enemy_class.__name__
+    return name
+
+
 class Level(pygame.sprite.LayeredUpdates):
-    def __init__(self, level_number, controls, sound_manager, engine):
+    def __init__(self, level_number, controls, sound_manager, engine, seed=None):
         super().__init__()
 
-        # Load tile metadata
-        with open(f"assets/tiles/level_{level_number}_data.json") as f:
-            self.tile_data = json.load(f)
+        # All gameplay randomness comes from here, so a seed + recorded input replays a run exactly
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self.rng = random.Random(self.seed)
+
+        # Everything that never changes during play is shared between attempts (see LevelTemplate)
+        self.template = get_level_template(level_number)
+        self.tile_data = self.template.tile_data
 
-        self.tile_size = self.tile_data["tile_size"]
-        self.tile_set = pygame.image.load(f"assets/tiles/level_{level_number}_set.png").convert_alpha()
+        self.tile_size = self.template.tile_size
+        self.tile_set = self.template.tile_set
+        self.tile_atlas = self.template.tile_atlas
 
         self.engine = engine
-        self.tile_grid = []  # 2D array for fast solid tile lookup
+        self.tile_ids = None  # [y, x] tile id per cell, 0 = empty
+        self.solid_grid = None  # [y, x] True for static solid cells
+        self.hitbox_grid = None  # [y, x] world-space hitbox (x, y, w, h) per cell
         self.last_player_tile = None
         self.grid_width = 0
         self.grid_height = 0
-        self.mp = None
+        self.mp = None  # Player distance map, indexed mp[x][y] (see DistanceField)
+        self.distance_field = None
         self.c = 0
         self.time_to_finish = 0
         self.start_time = 0
 
         self.tiles = pygame.sprite.Group()
+        self.static_layer = None  # Static tiles, baked into chunks from the grid when first visible
         self.updating_tiles = pygame.sprite.Group()
+        self.dynamic_solids = None  # Spatial index of moving solid tiles
+        self.entities = None  # Spatial index of player + enemies, refreshed every update
         self.enemies = pygame.sprite.Group()
         self.spawn = (0, 0)
         self.player = None
@@ -45,6 +65,11 @@ class Level(pygame.sprite.LayeredUpdates):
         self.width = 0
         self.height = 0
 
+        # Reused collision query buffers (see query_solids)
+        self.rect_pool = []
+        self.solid_query = []
+        self.dynamic_query = []
+
         self.sound_manager = sound_manager
         self.enemies_count = 0
         self.id = None
@@ -52,17 +77,12 @@ class Level(pygame.sprite.LayeredUpdates):
 
 
     def load_level(self, level_number, controls):
-        """Loads level structure from assets/levels/level_<id>.json"""
+        """Creates the mutable level state (player, enemies, tiles with behaviour) from the level template."""
         self.id = level_number
-        level_path = f"assets/levels/level_{level_number}.json"
-        if not os.path.exists(level_path):
-            raise FileNotFoundError(f"Level file {level_path} not found!")
-
-        with open(level_path) as f:
-            level_data = json.load(f)
+        template = self.template
 
         # Create player
-        self.spawn = (level_data["spawn"][0] * self.tile_size, level_data["spawn"][1] * self.tile_size)
+        self.spawn = template.spawn
         self.player = Player(
             self.spawn[0], self.spawn[1],
             "assets/characters/player.png",
@@ -70,52 +90,42 @@ class Level(pygame.sprite.LayeredUpdates):
             controls, self, self.sound_manager
         )
 
-        # Load enemies from JSON
-        enemies = level_data.get("enemies", [])
-        self.enemies_count = len(enemies)
-        for enemy_data in enemies:
-            enemy_type = enemy_data["type"]
-            x, y = enemy_data["x"] * self.tile_size, enemy_data["y"] * self.tile_size
-            if enemy_type in ENEMY_CLASSES:
-                enemy = ENEMY_CLASSES[enemy_type](
-                    x, y,
-                    f"assets/characters/{enemy_type}.png",
-                    f"assets/characters/{enemy_type}.json",
-                    self.player, self, self.sound_manager
-                )
-                self.enemies.add(enemy)
-
-        self.time_to_finish = level_data.get("time_to_finish", 0)
+        # Create enemies
+        self.enemies_count = template.enemies_count
+        for enemy_class, x, y, enemy_type in template.enemy_spawns:
+            enemy = enemy_class(
+                x, y,
+                f"assets/characters/{enemy_type}.png",
+                f"assets/characters/{enemy_type}.json",
+                self.player, self, self.sound_manager
+            )
+            self.enemies.add(enemy)
+
+        self.time_to_finish = template.time_to_finish
         self.start_time = time()
 
-        # Load tiles from JSON
-        tile_map = level_data["tiles"]
-        self.grid_height = len(tile_map)
-        self.grid_width = max(len(row) for row in tile_map)
-        self.tile_grid = [[None for _ in range(self.grid_width)] for _ in range(self.grid_height)]
-
-        for y, row in enumerate(tile_map):
-            for x, tile_id in enumerate(row):
-                if tile_id == 0:
-                    continue
-
-                tile_info = self.tile_data["tiles"].get(str(tile_id))
-                if not tile_info:
-                    continue
-
-                tile_class = TILES_CLASSES.get(tile_info["type"], Tile)
-                tile = tile_class(x * self.tile_size, y * self.tile_size, tile_info, self.tile_set, self.tile_size)
-
-                self.tiles.add(tile)
-                self.add(tile)
-
-                if tile.update_required:
-                    self.updating_tiles.add(tile)
-                if tile.solid:
-                    self.tile_grid[y][x] = tile
-
-                self.width = max(self.width, (x + 1) * self.tile_size)
-                self.height = max(self.height, (y + 1) * self.tile_size)
+        # Shared read-only grids, only the distance field holds per-attempt state
+        self.tile_ids = template.tile_ids
+        self.solid_grid = template.solid_grid
+        self.hitbox_grid = template.hitbox_grid
+        self.grid_height, self.grid_width = template.grid_height, template.grid_width
+        self.distance_field = DistanceField(template.walkable)
+
+        self.static_layer = template.static_layer
+        self.dynamic_solids = SpatialHash(self.tile_size * 4)
+        self.entities = SpatialHash(self.tile_size * 4)
+
+        # Only tiles with behaviour (spikes, moving platforms) become sprites
+        for tile_class, px, py, tile_info in template.tile_spawns:
+            tile = tile_class(px, py, tile_info, self.tile_atlas, self.tile_size)
+            self.tiles.add(tile)
+            self.add(tile)
+            self.updating_tiles.add(tile)
+            if tile.solid:
+                self.dynamic_solids.insert(tile, tile.rect)
+
+        self.width = template.width
+        self.height = template.height
 
         # Rebuild the pathfinding grid
         for enemy in self.enemies:
@@ -123,34 +133,64 @@ class Level(pygame.sprite.LayeredUpdates):
                 enemy.set_level(self)
 
     def get_tile_at(self, x, y):
-        """Returns the tile at the given world coordinate in pixel (x, y)."""
+        """Returns the tile id at the given world coordinate in pixel (x, y), 0 if empty."""
         grid_x = int(x // self.tile_size)
         grid_y = int(y // self.tile_size)
         if 0 <= grid_x < self.grid_width and 0 <= grid_y < self.grid_height:
-            return self.tile_grid[grid_y][grid_x]
-        return None
+            return int(self.tile_ids[grid_y, grid_x])
+        return 0
 
-    def get_solid_tiles_near(self, entity, radius=2):
-        """Returns nearby solid tiles for physics checks (grid + dynamic)."""
-        nearby_tiles = []
-        ex, ey = entity.rect.center
-        tile_x, tile_y = int(ex // self.tile_size), int(ey // self.tile_size)
+    def is_solid_at(self, x, y):
+        """Returns True if a static solid tile covers the cell at world coordinate (x, y)."""
+        grid_x = int(x // self.tile_size)
+        grid_y = int(y // self.tile_size)
+        if 0 <= grid_x < self.grid_width and 0 <= grid_y < self.grid_height:
+            return bool(self.solid_grid[grid_y, grid_x])
+        return False
 
-        for dy in range(-radius, radius + 1):
-            for dx in range(-radius, radius + 1):
-                gx = tile_x + dx
-                gy = tile_y + dy
-                if 0 <= gx < self.grid_width and 0 <= gy < self.grid_height:
-                    tile = self.tile_grid[gy][gx]
-                    if tile:
-                        nearby_tiles.append(tile)
+    def query_solids(self, rect):
+        """Returns hitboxes of all solids (static + moving) overlapping rect.
+        The returned list and its rects are reused by the next call, so consume it right away."""
+        result = self.solid_query
+        result.clear()
 
-        # Also check moving / dynamic tiles
-        for tile in self.updating_tiles:
-            if getattr(tile, "solid", False) and entity.rect.colliderect(tile.rect):
-                nearby_tiles.append(tile)
-
-        return nearby_tiles
+        tile_size = self.tile_size
+        x0, x1 = max(0, rect.left // tile_size), min(self.grid_width, (rect.right - 1) // tile_size + 1)
+        y0, y1 = max(0, rect.top // tile_size), min(self.grid_height, (rect.bottom - 1) // tile_size + 1)
+
+        if x0 < x1 and y0 < y1:
+            cells = self.solid_grid[y0:y1, x0:x1]
+            if cells.any():
+                pool = self.rect_pool
+                for hitbox in self.hitbox_grid[y0:y1, x0:x1][cells].tolist():
+                    if len(result) == len(pool):
+                        pool.append(pygame.Rect(0, 0, 0, 0))
+                    tile_rect = pool[len(result)]
+                    tile_rect.update(hitbox)
+                    if tile_rect.colliderect(rect):
+                        result.append(tile_rect)
+
+        # Moving solids come from their own index instead of scanning every updating tile
+        for tile in self.dynamic_solids.query_rect(rect, self.dynamic_query):
+            result.append(tile.rect)
+
+        return result
+
+    def add_enemy(self, enemy):
+        """Adds an enemy spawned during play (e.g. boss minions)."""
+        self.enemies.add(enemy)
+        self.entities.insert(enemy, enemy.rect)
+
+    def query_entities(self, rect):
+        """Returns player + enemies overlapping rect. Fresh list, safe to keep."""
+        return [entity for entity in self.entities.query_rect(rect) if entity.alive() or entity is self.player]
+
+    def query_entities_radius(self, center, radius):
+        """Returns player + enemies whose center lies within radius of center."""
+        return [
+            entity for entity in self.entities.query_radius(center, radius)
+            if entity.alive() or entity is self.player
+        ]
 
     def flip_gravity(self):
         """Flips gravity and mirrors entities vertically."""
@@ -160,12 +200,12 @@ class Level(pygame.sprite.LayeredUpdates):
 
     def check_touch(self, entity, engine):
         """Checks if the entity is touching an interactive tile (e.g., exits, pressure plates)."""
-        for tile in self.get_solid_tiles_near(entity):
-            if hasattr(tile, "on_touch"):  # If the tile has a special interaction
+        for tile in self.updating_tiles:
+            if hasattr(tile, "on_touch") and entity.rect.colliderect(tile.rect):  # Special interaction
                 tile.on_touch(engine)  # Trigger the tile's interaction
 
     def check_collision(self, entity):
-        return any(tile.rect.colliderect(entity.rect) for tile in self.get_solid_tiles_near(entity))
+        return bool(self.query_solids(entity.rect))
 
     def get_closest_pos(self, entity):
         """Returns the closest position to entity."""
@@ -180,7 +220,7 @@ class Level(pygame.sprite.LayeredUpdates):
         grid = level_data["tiles"]
         for x in range(-grid_range, grid_range):
             for y in range(-grid_range, grid_range):
-                if getattr(self.tile_grid[pos[0]+x][pos[1]+y], "solid", False):
+                if self.solid_grid[pos[0]+x, pos[1]+y]:
                     grid[pos[0]+x][pos[1]+y]=100+abs(x)+abs(y)
                 else:
                     grid[pos[0]+x][pos[1]+y]=-1
@@ -188,6 +228,18 @@ class Level(pygame.sprite.LayeredUpdates):
 
     def update(self, dt, engine):
         """Updates tiles, enemies, and player."""
+        # Remember the last simulation state for render interpolation
+        self.player.prev_pos = self.player.rect.topleft
+        for enemy in self.enemies:
+            enemy.prev_pos = enemy.rect.topleft
+        for tile in self.updating_tiles:
+            tile.prev_pos = tile.rect.topleft
+
+        # Rebuild the entity index, then keep it in sync as entities move
+        self.entities.clear()
+        self.entities.insert(self.player, self.player.rect)
+        for enemy in self.enemies:
+            self.entities.insert(enemy, enemy.rect)
 
         current_tile = (
             self.player.rect.centerx // self.tile_size,
@@ -197,24 +249,42 @@ class Level(pygame.sprite.LayeredUpdates):
             self.last_player_tile = current_tile
             self.setup_player_map(*self.player.rect.center)
 
-        self.updating_tiles.update(engine)
+        profiler = engine.profiler
+        with profiler.span("tiles"):
+            self.updating_tiles.update(engine)
 
+        timed = profiler.enabled  # Per-enemy timing costs two clock reads per enemy, skip it when not profiling
         for enemy in self.enemies:
             if engine.camera.camera.colliderect(enemy.rect.inflate(100, 100)):  # slightly bigger area to preload
-                enemy.update(self, dt)
+                if timed:
+                    start = perf_counter_ns()
+                    enemy.update(self, dt)
+                    profiler.add(enemy_span_name(type(enemy)), perf_counter_ns() - start)
+                else:
+                    enemy.update(self, dt)
+                if enemy.alive():
+                    self.entities.update(enemy, enemy.rect)
+                else:
+                    self.entities.remove(enemy)
 
-        self.player.update(self, dt)
+        with profiler.span("player"):
+            self.player.update(self, dt)
+        self.entities.update(self.player, self.player.rect)
 
     def render(self, screen, camera):
         """Renders everything inside the level."""
         camera_rect = camera.camera
-        for tile in self.tiles:
-            if camera_rect.colliderect(tile.rect):
-                screen.blit(tile.image, camera.apply(tile).topleft)
-        for enemy in self.enemies:
-            if camera_rect.colliderect(enemy.rect):
-                enemy.render(screen, camera, self.engine.debug_overlay)
-        self.player.render(screen,camera, self.engine.debug_overlay)
+        profiler = self.engine.profiler
+        with profiler.span("tile_render"):
+            self.static_layer.render(screen, camera)
+            for tile in self.updating_tiles:
+                if camera_rect.colliderect(tile.rect):
+                    screen.blit(tile.image, camera.apply(tile).topleft)
+        with profiler.span("entity_render"):
+            for enemy in self.enemies:
+                if camera_rect.colliderect(enemy.rect):
+                    enemy.render(screen, camera, self.engine.debug_overlay)
+            self.player.render(screen,camera, self.engine.debug_overlay)
 
         if self.engine.debug_overlay:
             self.draw_debug_mp(screen, camera)
@@ -236,7 +306,7 @@ class Level(pygame.sprite.LayeredUpdates):
                 screen_y = y * tile_size
                 pos = camera.apply(pygame.Rect(screen_x, screen_y, tile_size, tile_size)).topleft
 
-                if self.tile_grid[y][x]:  # Wall tile
+                if self.solid_grid[y, x]:  # Wall tile
                     pygame.draw.rect(screen, (255, 0, 0), (*pos, tile_size, tile_size), 1)
                 elif (x, y) == player_tile:
                     pygame.draw.rect(screen, (0, 255, 0), (*pos, tile_size, tile_size), 1)
@@ -247,40 +317,13 @@ class Level(pygame.sprite.LayeredUpdates):
                     screen.blit(text, pos)
 
     def setup_player_map(self, x, y):
-        # Use NumPy for faster array operations
-        self.mp = np.full((self.grid_width, self.grid_height), 1000, dtype=np.int16)
-
         # Create player map with extended range
         self.create_player_map(x, y, 20)
+        self.mp = self.distance_field.mp
 
     def create_player_map(self, x, y, max_distance):
+        """Moves the distance field source to the world position (x, y).
+        A one-tile step repairs the existing field, anything else rebuilds it."""
         start_x = math.floor(x / self.tile_size)
         start_y = math.floor(y / self.tile_size)
-
-        if (start_x < 0 or start_y < 0 or
-                start_x >= self.grid_width or start_y >= self.grid_height or
-                self.tile_grid[start_y][start_x]):
-            return
-
-        queue = deque()
-        queue.append((start_x, start_y, 0))
-        visited = np.zeros((self.grid_width, self.grid_height), dtype=bool)
-
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-
-        while queue:
-            x, y, dist = queue.popleft()
-
-            if dist >= max_distance or visited[x][y]:
-                continue
-
-            visited[x][y] = True
-            self.mp[x][y] = min(self.mp[x][y], dist)
-
-            for dx, dy in directions:
-                nx, ny = x + dx, y + dy
-                if (0 <= nx < self.grid_width and
-                        0 <= ny < self.grid_height and
-                        not visited[nx][ny] and
-                        not self.tile_grid[ny][nx]):
-                    queue.append((nx, ny, dist + 1))
+        self.distance_field.update_source(start_x, start_y, max_distance)
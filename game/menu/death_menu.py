@@ -2,6 +2,8 @@ from game.menu.menu_structure import MenuPage, Button
 from game.menu.menu_state import MenuState
 
 class DeathMenu(MenuPage):
+    static = True
+
     def __init__(self, screen_size, button_images, font_manager, sound_manager):
         super().__init__(font_manager, sound_manager)
         self.screen_size = screen_size
@@ -16,7 +18,7 @@ class DeathMenu(MenuPage):
 
         self.title = "YOU DIED"
 
-    def render(self, surface):
+    def render_static(self, surface):
         self.font_manager.render(
             surface=surface,
             text=self.title,
@@ -25,6 +27,9 @@ class DeathMenu(MenuPage):
             color=(255, 80, 80),
             align_center=True
         )
+
+    def render(self, surface):
+        self.render_static(surface)
         super().render(surface)
 
     def handle_event(self, event, engine, mouse_pos):
@@ -4,7 +4,7 @@ import sys
 from core.game_data import get_game_data
 from game.menu.menu_structure import MenuPage, Button
 from game.menu.menu_state import MenuState
-from game.background import Background
+from game.background import BackgroundCompositor
 
 
 class MainMenu(MenuPage):
@@ -18,10 +18,8 @@ class MainMenu(MenuPage):
         self.title_color = (255, 233, 71)
 
         # Load scrolling background layers (static + scroll types)
-        self.backgrounds = []
         bg_data = get_game_data("main_menu_background")
-        for layer in bg_data[::-1]:  # Back to front
-            self.backgrounds.append(Background(layer))
+        self.background = BackgroundCompositor(bg_data[::-1])  # Back to front
 
         spacing = 70
         button_names = ["play", "levels", "options", "exit"]
@@ -31,8 +29,7 @@ class MainMenu(MenuPage):
 
     def render(self, surface):
         # Background layers (static or scroll)
-        for bg in self.backgrounds:
-            bg.render(surface, camera=None)  # No camera in menu
+        self.background.render(surface, camera=None)  # No camera in menu
 
         # Title
         self.font_manager.render(
@@ -58,7 +55,7 @@ class MainMenu(MenuPage):
         )
 
     def update(self, mouse_pos):
-        for bg in self.backgrounds:
+        for bg in self.background.layers:
             if bg.type == "scroll":
                 bg.offset += bg.speed
         super().update(mouse_pos)
@@ -10,6 +10,7 @@ from game.menu.pause_menu import PauseMenu
 from game.menu.death_menu import DeathMenu
 from game.menu.settings_menu import SettingsMenu
 from game.menu.win_menu import WinMenu
+from core.assets import load_image
 
 
 class Menu:
@@ -29,6 +30,14 @@ class Menu:
         self.last_frame = None
         self.back_redirect = MenuState.MAIN
 
+        # Dimming overlay, allocated once
+        self.dim_overlay = pygame.Surface(self.screen_size, pygame.SRCALPHA)
+        self.dim_overlay.fill((0, 0, 0, 128))
+
+        # Retained rendering of static pages: composed background + the page it was composed for
+        self.background = None
+        self.background_page = None
+
     @staticmethod
     def load_button_images():
         with open("assets/menu/menu.json") as f:
@@ -36,7 +45,7 @@ class Menu:
 
         buttons = {}
         for key, entry in data.items():
-            img = pygame.image.load(os.path.join("assets/menu",entry["image"])).convert_alpha()
+            img = load_image(os.path.join("assets/menu", entry["image"]))
             w = entry["frame_width"]
             h = img.get_height()
             frames = [img.subsurface(pygame.Rect(i * w, 0, w, h)) for i in range(img.get_width() // w)]
@@ -111,11 +120,52 @@ class Menu:
             surface.blit(self.last_frame, (0, 0))
 
         # Overlay
-        overlay = pygame.Surface(self.screen_size, pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        surface.blit(overlay, (0, 0))
+        surface.blit(self.dim_overlay, (0, 0))
 
         # Actual menu page
         self.current_page.update(mouse_pos)
         self.current_page.render(surface)
 
+    def is_static(self):
+        return self.active_type != MenuState.NONE and self.current_page is not None and self.current_page.static
+
+    def invalidate(self):
+        """Forces the next render_changes to compose the whole frame again (e.g. after a resize)."""
+        self.background_page = None
+
+    def render_changes(self, surface, engine):
+        """Retained rendering of a static page onto the surface of the previous frame.
+        Returns None if the whole surface was redrawn, otherwise the list of rects that changed."""
+        page = self.current_page
+        page.update(engine.get_scaled_mouse())
+
+        if self.background_page is not page:
+            # Compose last frame, dimming and the page's static content once
+            if self.background is None:
+                self.background = pygame.Surface(self.screen_size)
+            if self.last_frame:
+                self.background.blit(self.last_frame, (0, 0))
+            else:
+                self.background.fill((0, 0, 0))
+            self.background.blit(self.dim_overlay, (0, 0))
+            page.render_static(self.background)
+            self.background_page = page
+
+            surface.blit(self.background, (0, 0))
+            for button in page.buttons:
+                button.render(surface)
+            return None
+
+        dirty = []
+        for button in page.buttons:
+            image = button.get_image()
+            if image is button.drawn_image:
+                continue
+            area = button.rect.union(image.get_rect(topleft=button.rect.topleft))
+            if button.drawn_image is not None:
+                area.union_ip(button.drawn_image.get_rect(topleft=button.rect.topleft))
+            surface.blit(self.background, area, area)
+            button.render(surface)
+            dirty.append(area)
+        return dirty
+
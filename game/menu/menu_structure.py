@@ -16,6 +16,7 @@ class Button:
         self.hovering = False
 
         self.rect = self.idle_image.get_rect(center=pos)
+        self.drawn_image = None  # Image of the last render (retained menus redraw only on change)
 
     def scale_image(self, img):
         if self.scale == 1:
@@ -37,10 +38,14 @@ class Button:
             self.hover_index = 0
             self.frame_timer = 0
 
+    def get_image(self):
+        return self.hover_images[self.hover_index] if self.hovering and self.hover_images else self.idle_image
+
     def render(self, surface):
         # Draw button
-        image = self.hover_images[self.hover_index] if self.hovering and self.hover_images else self.idle_image
+        image = self.get_image()
         surface.blit(image, self.rect)
+        self.drawn_image = image
 
     def is_clicked(self, event, mouse_pos):
         is_clicked =  (
@@ -53,6 +58,10 @@ class Button:
         return is_clicked
 
 class MenuPage:
+    # Static pages only change where their buttons are: Menu composes everything else once
+    # (render_static) and afterwards just redraws buttons whose image changed.
+    static = False
+
     def __init__(self, font_manager, sound_manager):
         self.buttons = []
         self.font_manager = font_manager
@@ -65,6 +74,10 @@ class MenuPage:
         for button in self.buttons:
             button.update(mouse_pos)
 
+    def render_static(self, surface):
+        """Draws everything except the buttons (static pages only)."""
+        pass
+
     def render(self, surface):
         for button in self.buttons:
             button.render(surface)
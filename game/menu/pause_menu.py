@@ -4,6 +4,8 @@ from game.menu.menu_structure import MenuPage, Button
 from game.menu.menu_state import MenuState
 
 class PauseMenu(MenuPage):
+    static = True
+
     def __init__(self, screen_size, button_images, font_manager, sound_manager):
         super().__init__(font_manager, sound_manager)
         self.screen_size = screen_size
@@ -15,7 +17,7 @@ class PauseMenu(MenuPage):
             y = self.cy - spacing + i * spacing
             self.add_button(Button(name, button_images[name], (self.cx, y), sound_manager))
 
-    def render(self, surface):
+    def render_static(self, surface):
         self.font_manager.render(
             text="Paused",
             surface=surface,
@@ -24,6 +26,9 @@ class PauseMenu(MenuPage):
             color=(255, 255, 255),
             align_center=True
         )
+
+    def render(self, surface):
+        self.render_static(surface)
         super().render(surface)
 
     def handle_event(self, event, engine, mouse_pos):
@@ -4,6 +4,7 @@ from time import time
 
 from game.menu.menu_structure import MenuPage, Button
 from game.menu.menu_state import MenuState
+from core.assets import load_image
 
 class WinMenu(MenuPage):
     def __init__(self, screen_size, button_images, font_manager, sound_manager, level):
@@ -39,8 +40,8 @@ class WinMenu(MenuPage):
         self.global_frame = 0
 
         # Load star images
-        self.star_image_full = pygame.image.load("assets/menu/star.png").convert_alpha()
-        self.star_image_empty = pygame.image.load("assets/menu/star_empty.png").convert_alpha()
+        self.star_image_full = load_image("assets/menu/star.png")
+        self.star_image_empty = load_image("assets/menu/star_empty.png")
         self.star_image_full = pygame.transform.scale(self.star_image_full, (self.star_size, self.star_size))
         self.star_image_empty = pygame.transform.scale(self.star_image_empty, (self.star_size, self.star_size))
 
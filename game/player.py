@@ -115,11 +115,11 @@ class Player(Entity):
 
         # Handle movement
         if not self.controls_inverted:
-            left = self.controls.is_action_active("move_left")
-            right = self.controls.is_action_active("move_right")
+            left = self.controls.is_down("move_left")
+            right = self.controls.is_down("move_right")
         else:
-            left = self.controls.is_action_active("move_right")
-            right = self.controls.is_action_active("move_left")
+            left = self.controls.is_down("move_right")
+            right = self.controls.is_down("move_left")
 
         if self.stun == 0 and not self.attack_active:
             if left and right:
@@ -134,7 +134,7 @@ class Player(Entity):
                 new_state = "run"
 
         # Handle jumping (hold jump for higher jumps)
-        jump_pressed = self.controls.is_action_active("jump")
+        jump_pressed = self.controls.is_down("jump")
         jump_direction = -1 if self.is_flipped else 1  # Flip jump when gravity is inverted
 
         # Jump
@@ -182,7 +182,7 @@ class Player(Entity):
             self.jump_anim_done = False  # Reset animation lock
 
         # Handle Attacking (LEFT-CLICK)
-        if pygame.mouse.get_pressed()[0] and not self.attack_cooldown:
+        if self.controls.is_down("attack") and not self.attack_cooldown:
             self.charge = min(self.charge + 1, self.max_charge)
             self.speed = self.charge_speed
             new_state = "charge"
@@ -203,11 +203,11 @@ class Player(Entity):
                 self.attack_active = False  # End attack after animation
 
         # Gravity Ability
-        if self.controls.is_action_active("gravity_inverse"):
+        if self.controls.is_down("gravity_inverse"):
             self.abilities["gravity_inverse"].activate()
 
         # Heal Ability
-        if self.controls.is_action_active("heal"):
+        if self.controls.is_down("heal"):
             self.abilities["heal"].activate()
 
         super().update(level, dt)  # Apply physics and collision
@@ -232,8 +232,8 @@ class Player(Entity):
         total_hitbox = self.rect.union(attack_rect) # Combine player and attack hitbox
 
         # Check collision with enemies
-        for enemy in level.enemies:
-            if total_hitbox.colliderect(enemy.rect):
+        for enemy in level.query_entities(total_hitbox):
+            if enemy is not self:
                 enemy.hit(self)
 
 
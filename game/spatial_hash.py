@@ -0,0 +1,88 @@
+import pygame
+
+
+class SpatialHash:
+    def __init__(self, cell_size):
+        """Uniform grid that buckets objects with a .rect by the cells their rect overlaps."""
+        self.cell_size = cell_size
+        self.cells = {}  # (col, row) -> list of objects
+        self.ranges = {}  # object -> (col0, row0, col1, row1) it is stored under
+
+    def __len__(self):
+        return len(self.ranges)
+
+    def __contains__(self, obj):
+        return obj in self.ranges
+
+    def cell_range(self, rect):
+        """Returns the inclusive cell range (col0, row0, col1, row1) covered by rect."""
+        size = self.cell_size
+        return (rect.left // size, rect.top // size,
+                (rect.right - 1) // size, (rect.bottom - 1) // size)
+
+    def insert(self, obj, rect):
+        cell_range = self.cell_range(rect)
+        self.ranges[obj] = cell_range
+        col0, row0, col1, row1 = cell_range
+        for row in range(row0, row1 + 1):
+            for col in range(col0, col1 + 1):
+                bucket = self.cells.get((col, row))
+                if bucket is None:
+                    self.cells[(col, row)] = [obj]
+                else:
+                    bucket.append(obj)
+
+    def remove(self, obj):
+        cell_range = self.ranges.pop(obj, None)
+        if cell_range is None:
+            return
+        col0, row0, col1, row1 = cell_range
+        for row in range(row0, row1 + 1):
+            for col in range(col0, col1 + 1):
+                bucket = self.cells[(col, row)]
+                bucket.remove(obj)
+                if not bucket:
+                    del self.cells[(col, row)]
+
+    def update(self, obj, rect):
+        """Re-buckets an object after it moved. Cheap when it stays in the same cells."""
+        if self.ranges.get(obj) == self.cell_range(rect):
+            return
+        self.remove(obj)
+        self.insert(obj, rect)
+
+    def clear(self):
+        self.cells.clear()
+        self.ranges.clear()
+
+    def query_rect(self, rect, out=None):
+        """Returns all objects whose rect overlaps rect. Fills and returns out if given."""
+        if out is None:
+            out = []
+        else:
+            out.clear()
+
+        col0, row0, col1, row1 = self.cell_range(rect)
+        single_cell = col0 == col1 and row0 == row1
+        for row in range(row0, row1 + 1):
+            for col in range(col0, col1 + 1):
+                bucket = self.cells.get((col, row))
+                if not bucket:
+                    continue
+                for obj in bucket:
+                    # Objects spanning several cells show up in each of them
+                    if rect.colliderect(obj.rect) and (single_cell or obj not in out):
+                        out.append(obj)
+        return out
+
+    def query_radius(self, center, radius, out=None):
+        """Returns all objects whose rect center lies within radius of center."""
+        cx, cy = center
+        size = int(radius) * 2 + 1
+        out = self.query_rect(pygame.Rect(int(cx - radius), int(cy - radius), size, size), out)
+        radius_sq = radius * radius
+        out[:] = [
+            obj for obj in out
+            if (obj.rect.centerx - cx) ** 2 + (obj.rect.centery - cy) ** 2 <= radius_sq
+        ]
+        return out
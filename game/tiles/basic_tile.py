@@ -4,7 +4,10 @@ from game.tiles.tiles_register import register_tile
 
 @register_tile("block")
 class Tile(pygame.sprite.Sprite):
-    def __init__(self, x, y, tile_info, tile_set, tile_size):
+    # Determines if this tile needs updating every frame (and its own sprite instead of the static layer)
+    update_required = False
+
+    def __init__(self, x, y, tile_info, tile_atlas, tile_size):
         super().__init__()
 
         # Extract tile metadata
@@ -20,17 +23,8 @@ class Tile(pygame.sprite.Sprite):
         self.hitbox_offset_x = hitbox.get("offset_x", 0.0) * tile_size
         self.hitbox_offset_y = hitbox.get("offset_y", 0.0) * tile_size
 
-        # Determines if this tile needs updating every frame
-        self.update_required = False
-
-        # Compute texture position from index
-        tiles_per_row = tile_set.get_width() // tile_size
-        texture_x = (self.index % tiles_per_row) * tile_size
-        texture_y = (self.index // tiles_per_row) * tile_size
-
-        # Extract texture from tile_set
-        self.image = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
-        self.image.blit(tile_set, (0, 0), (texture_x, texture_y, tile_size, tile_size))
+        # Texture is shared between all tiles with the same index (counted once by the level template)
+        self.image = tile_atlas.get(self.index, count=0)
 
         # Position and hitbox
         self.rect = pygame.Rect(
@@ -4,10 +4,10 @@ from game.tiles.tiles_register import register_tile
 
 @register_tile("moving_platform")
 class MovingPlatform(Tile):
-    def __init__(self, x, y, tile_info, tile_set, tile_size):
-        super().__init__(x, y, tile_info, tile_set, tile_size)
+    update_required = True  # Ensure the platform updates every frame
 
-        self.update_required = True  # Ensure the platform updates every frame
+    def __init__(self, x, y, tile_info, tile_atlas, tile_size):
+        super().__init__(x, y, tile_info, tile_atlas, tile_size)
 
         self.speed = self.metadata.get("speed", 1)
         self.range = self.metadata.get("range", float('inf'))
@@ -21,7 +21,6 @@ class MovingPlatform(Tile):
     def update(self, engine):
         """Moves the platform and interacts with the player + enemies."""
         level = engine.level
-        player = level.player
 
         self.distance += 1
         if self.distance >= self.range:
@@ -47,15 +46,16 @@ class MovingPlatform(Tile):
             )
 
         # Check for solid collisions
-        if any(tile.rect.colliderect(check_rect) for tile in level.get_solid_tiles_near(self)):
+        if level.query_solids(check_rect):
             self.movement_direction *= -1
             return
 
         # Move platform if no collision
         self.rect = next_rect
+        level.dynamic_solids.update(self, self.rect)
 
-        # Carry entities smoothly
-        for entity in [player] + list(level.enemies):
+        # Carry entities smoothly (only ones touching the platform can be affected)
+        for entity in level.query_entities(self.rect.inflate(2, 2)):
             if type(entity).__name__ == "Neuros":
                 continue
             is_above = (
@@ -77,13 +77,13 @@ class MovingPlatform(Tile):
                 future_rect = entity.rect.move(delta_x, 0)
                 if delta_x != 0:
                     wall_check = pygame.Rect(future_rect.x, future_rect.y, future_rect.width, future_rect.height)
-                    if any(tile.rect.colliderect(wall_check) for tile in level.get_solid_tiles_near(entity)):
+                    if level.query_solids(wall_check):
                         will_touch_wall = True
             else:
                 future_rect = entity.rect.move(0, delta_y)
                 if delta_y != 0:
                     wall_check = pygame.Rect(future_rect.x, future_rect.y, future_rect.width, future_rect.height)
-                    if any(tile.rect.colliderect(wall_check) for tile in level.get_solid_tiles_near(entity)):
+                    if level.query_solids(wall_check):
                         will_touch_wall = True
 
             if self.direction == "horizontal:":
@@ -93,6 +93,7 @@ class MovingPlatform(Tile):
                     entity.rect.x += delta_x
                     entity.velocity.x = delta_x
                     entity.on_ground = True
+                    level.entities.update(entity, entity.rect)
                     continue
             else:
                 # Carrying logic
@@ -101,6 +102,7 @@ class MovingPlatform(Tile):
                     entity.rect.x += delta_x
                     entity.velocity.y = delta_y
                     entity.on_ground = True
+                    level.entities.update(entity, entity.rect)
                     continue
 
             # Check for wall collisions
@@ -109,10 +111,12 @@ class MovingPlatform(Tile):
                     entity.eliminate()
                 elif self.direction == "horizontal":
                     entity.rect.x += delta_x
+                    level.entities.update(entity, entity.rect)
                     if entity.on_ground:
                         entity.velocity.x = delta_x
                 else:
                     entity.rect.y += delta_y
+                    level.entities.update(entity, entity.rect)
                     if entity.on_ground:
                         entity.velocity.y = delta_y
 
@@ -125,23 +129,19 @@ class MovingPlatform(Tile):
         right_blocked = False
 
         if direction == "horizontal":
-            left_blocked = any(
-                tile.rect.colliderect(pygame.Rect(entity.rect.left - 1, entity.rect.y, 1, entity.rect.height))
-                for tile in level.get_solid_tiles_near(entity)
-            )
-            right_blocked = any(
-                tile.rect.colliderect(pygame.Rect(entity.rect.right + 1, entity.rect.y, 1, entity.rect.height))
-                for tile in level.get_solid_tiles_near(entity)
-            )
+            left_blocked = bool(level.query_solids(
+                pygame.Rect(entity.rect.left - 1, entity.rect.y, 1, entity.rect.height)
+            ))
+            right_blocked = bool(level.query_solids(
+                pygame.Rect(entity.rect.right + 1, entity.rect.y, 1, entity.rect.height)
+            ))
         else:
-            top_blocked = any(
-                tile.rect.colliderect(pygame.Rect(entity.rect.x, entity.rect.top - 1, entity.rect.width, 1))
-                for tile in level.get_solid_tiles_near(entity)
-            )
-            bottom_blocked = any(
-                tile.rect.colliderect(pygame.Rect(entity.rect.x, entity.rect.bottom + 1, entity.rect.width, 1))
-                for tile in level.get_solid_tiles_near(entity)
-            )
+            top_blocked = bool(level.query_solids(
+                pygame.Rect(entity.rect.x, entity.rect.top - 1, entity.rect.width, 1)
+            ))
+            bottom_blocked = bool(level.query_solids(
+                pygame.Rect(entity.rect.x, entity.rect.bottom + 1, entity.rect.width, 1)
+            ))
 
         return (left_blocked and right_blocked) or (top_blocked and bottom_blocked)
 
@@ -0,0 +1,75 @@
+from collections import OrderedDict
+
+import numpy as np
+import pygame
+
+
+class StaticTileLayer:
+    def __init__(self, width, height, chunk_size=512, budget=None):
+        """Pre-composited tile layer, split into fixed-size chunks so only visible chunks get blitted.
+        Chunks are baked from the tile grid the first time they are visible. budget (bytes) caps the baked
+        chunks kept, the least recently drawn ones get dropped and rebaked when needed."""
+        self.chunk_size = chunk_size
+        self.cols = -(-width // chunk_size)
+        self.rows = -(-height // chunk_size)
+        self.tile_ids = None  # [y, x] tile id grid
+        self.images = []  # Tile id -> image of static tiles, None for ids drawn elsewhere
+        self.static = None  # [y, x] True where a static tile sits
+        self.tile_size = 1
+        self.chunks = OrderedDict()  # (col, row) -> baked Surface, least recently drawn first
+        self.empty = set()  # Chunks known to hold no static tiles
+        self.max_chunks = None if budget is None else max(1, budget // (chunk_size * chunk_size * 4))
+        self.bakes = 0
+
+    def set_tiles(self, tile_ids, images, tile_size):
+        """Uses the [y, x] tile id grid as content. images[id] is the image of a static tile id, None for others."""
+        self.tile_ids = tile_ids
+        self.images = images
+        self.tile_size = tile_size
+        self.static = np.array([image is not None for image in images], dtype=bool)[tile_ids]
+        self.chunks.clear()
+        self.empty.clear()
+
+    def get_chunk(self, key):
+        """Returns the baked chunk surface (None if it holds no tiles)."""
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            self.chunks.move_to_end(key)
+            return chunk
+        if key in self.empty or self.static is None:
+            return None
+
+        # Cells overlapping the chunk (tiles on a chunk border get drawn into both chunks)
+        size, tile_size = self.chunk_size, self.tile_size
+        col, row = key
+        x0, y0 = col * size // tile_size, row * size // tile_size
+        x1, y1 = -(-(col + 1) * size // tile_size), -(-(row + 1) * size // tile_size)
+        ys, xs = np.nonzero(self.static[y0:y1, x0:x1])
+        if not len(ys):
+            self.empty.add(key)
+            return None
+
+        images = self.images
+        ids = self.tile_ids[y0:y1, x0:x1][ys, xs].tolist()
+        px = ((xs + x0) * tile_size - col * size).tolist()
+        py = ((ys + y0) * tile_size - row * size).tolist()
+
+        chunk = pygame.Surface((size, size), pygame.SRCALPHA)
+        chunk.blits([(images[tile_id], (x, y)) for tile_id, x, y in zip(ids, px, py)], doreturn=False)
+        self.chunks[key] = chunk
+        self.bakes += 1
+        if self.max_chunks is not None and len(self.chunks) > self.max_chunks:
+            self.chunks.popitem(last=False)
+        return chunk
+
+    def render(self, screen, camera):
+        """Blits the chunks overlapping the camera view."""
+        size = self.chunk_size
+        sw, sh = screen.get_size()
+        ox, oy = camera.offset_x, camera.offset_y
+
+        for row in range(max(0, oy // size), min(self.rows, (oy + sh - 1) // size + 1)):
+            for col in range(max(0, ox // size), min(self.cols, (ox + sw - 1) // size + 1)):
+                chunk = self.get_chunk((col, row))
+                if chunk:
+                    screen.blit(chunk, (col * size - ox, row * size - oy))
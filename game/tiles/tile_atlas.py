@@ -0,0 +1,33 @@
+import pygame
+
+
+class TileAtlas:
+    def __init__(self, tile_set, tile_size):
+        """Per-level cache of tile images keyed by tile-set index, shared by all tiles of that type."""
+        self.tile_set = tile_set
+        self.tile_size = tile_size
+        self.tiles_per_row = tile_set.get_width() // tile_size
+        self.images = {}
+        self.requests = 0  # How many tiles asked for an image (one surface each without the atlas)
+
+    def get(self, index, count=1):
+        """Returns the shared image for a tile-set index, cutting it out on first use.
+        count: number of tiles the image is requested for."""
+        self.requests += count
+        image = self.images.get(index)
+        if image is None:
+            texture_x = (index % self.tiles_per_row) * self.tile_size
+            texture_y = (index // self.tiles_per_row) * self.tile_size
+
+            image = pygame.Surface((self.tile_size, self.tile_size), pygame.SRCALPHA)
+            image.blit(self.tile_set, (0, 0), (texture_x, texture_y, self.tile_size, self.tile_size))
+            self.images[index] = image
+        return image
+
+    def surface_bytes(self):
+        """Pixel memory held by the shared images."""
+        return sum(image.get_bytesize() * image.get_width() * image.get_height() for image in self.images.values())
+
+    def unshared_bytes(self):
+        """Pixel memory one surface per tile would need."""
+        return self.requests * self.tile_size * self.tile_size * 4
@@ -3,9 +3,12 @@ import os
 import json
 from time import time
 from game.menu.menu import MenuState
+from core.assets import load_image
 
 
 class UI:
+    TIMER_SIZE = 32
+
     def __init__(self, font_manager, sound_manager):
         """Initializes UI with optimized asset loading and caching."""
         self.font_manager = font_manager
@@ -51,18 +54,16 @@ class UI:
         self.time_elapsed = 0
 
         # Cached text
-        self.last_timer_text = ""
         self.last_kill_text = ""
-        self.cached_timer_surface = None
         self.cached_kill_surface = None
 
     def _load_icon(self, filename, size):
         path = os.path.join("assets/ui", filename)
-        image = pygame.image.load(path).convert_alpha()
+        image = load_image(path)
         return pygame.transform.scale(image, (size, size))
 
     def _load_pause_frames(self, ui_data):
-        sheet = pygame.image.load(os.path.join("assets/ui", ui_data["pause"])).convert_alpha()
+        sheet = load_image(os.path.join("assets/ui", ui_data["pause"]))
         width = self.button_size
         height = sheet.get_height()
         frames = [sheet.subsurface(pygame.Rect(i * width, 0, width, height))
@@ -72,6 +73,10 @@ class UI:
             "hover": frames[1:] if len(frames) > 1 else [frames[0]]
         }
 
+    def prepare(self):
+        """Builds what the first in-game frame would otherwise build (timer glyphs)."""
+        self.font_manager.get_glyph_atlas(self.TIMER_SIZE)
+
     def update(self, player):
         """Updates internal state from player."""
         self.mouse_pos = pygame.mouse.get_pos()
@@ -158,15 +163,8 @@ class UI:
         seconds = self.time_elapsed % 60
         timer_text = f"{minutes}:{seconds:.2f}"
 
-        if timer_text != self.last_timer_text:
-            self.last_timer_text = timer_text
-            self.cached_timer_surface = self.font_manager.render_to_surface(
-                timer_text, size=32
-            )
-
-        if self.cached_timer_surface:
-            x = screen.get_width() // 2 - self.cached_timer_surface.get_width() // 2
-            screen.blit(self.cached_timer_surface, (x, 30))
+        # Changes every frame: drawn glyph by glyph instead of rendering a new surface
+        self.font_manager.render_glyphs(screen, timer_text, (screen.get_width() // 2, 30), size=self.TIMER_SIZE, align_center=True)
 
     def _render_kill_counter(self, screen, width):
         kill_text = f"{self.killed_enemies}/{self.total_enemies}"
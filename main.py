@@ -1,12 +1,48 @@
+import argparse
 import sys
 import traceback
 from core.game_data import load_data
 from core.engine import GameEngine
+from core.replay import Replay
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Protocol: Disconnect")
+    parser.add_argument("--headless", action="store_true",
+                        help="simulate a level without window and audio and print the simulation speed")
+    parser.add_argument("--level", type=int, default=0, help="level to simulate in headless mode")
+    parser.add_argument("--frames", type=int, default=10000, help="number of frames to simulate in headless mode")
+    parser.add_argument("--record", metavar="PATH", help="record the input of every level attempt to PATH")
+    parser.add_argument("--replay", metavar="PATH",
+                        help="play back a recorded run (headless: as fast as possible, as a benchmark)")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="write per-frame timings to PATH (.json or .csv) when the game exits")
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
+    args = parse_args()
     try:
         load_data("data/game_data.json")
-        game = GameEngine()
+        replay = Replay.load(args.replay) if args.replay else None
+        if args.headless:
+            game = GameEngine(headless=True, profile_path=args.profile, record_path=args.record)
+            if replay is not None:
+                fps = game.run_replay(replay)
+                player = game.level.player
+                print(f"[INFO] Replay of level {replay.level_id}: {replay.position} ticks at {fps:.0f} ticks/s, "
+                      f"player at {tuple(player.rect.topleft)} with {player.health} health, "
+                      f"{len(game.level.enemies)} enemies left")
+            else:
+                fps = game.run_headless(args.level, args.frames)
+                print(f"[INFO] Level {args.level}: simulated {args.frames} frames at {fps:.0f} frames/s")
+            game.save_recording()
+            if args.profile:
+                game.dump_profile(args.profile)
+            sys.exit(0)
+        game = GameEngine(profile_path=args.profile, record_path=args.record)
+        if replay is not None:
+            game.start_replay(replay)
         game.run()
     except KeyboardInterrupt:
         print("\n[INFO] Exiting game...")